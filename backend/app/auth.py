@@ -18,6 +18,46 @@ logger = logging.getLogger(__name__)
 # In-memory session store (use Redis in production)
 _sessions: Dict[str, Dict[str, Any]] = {}
 
+# Expired sessions that are never looked up again are swept from the store
+# when new sessions are created, at most once per interval
+_SESSION_CLEANUP_INTERVAL = timedelta(seconds=60)
+_last_session_cleanup = datetime.utcnow()
+
+
+# SAML claim names to try, in order, for each user field (Microsoft names first)
+_EMAIL_CLAIMS = (
+    "http://schemas.xmlsoap.org/ws/2005/05/identity/claims/emailaddress",
+    "email",
+    "mail",
+)
+_GIVEN_NAME_CLAIMS = (
+    "http://schemas.xmlsoap.org/ws/2005/05/identity/claims/givenname",
+    "givenname",
+    "firstname",
+)
+_SURNAME_CLAIMS = (
+    "http://schemas.xmlsoap.org/ws/2005/05/identity/claims/surname",
+    "surname",
+    "lastname",
+)
+_GROUPS_CLAIMS = (
+    "http://schemas.microsoft.com/ws/2008/06/identity/claims/groups",
+    "groups",
+)
+
+
+def _purge_expired_sessions(now: datetime) -> None:
+    """Drop expired sessions if the cleanup interval has elapsed"""
+    global _last_session_cleanup
+    if now - _last_session_cleanup < _SESSION_CLEANUP_INTERVAL:
+        return
+    expired = [token for token, session in _sessions.items() if now > session["expires_at"]]
+    for token in expired:
+        del _sessions[token]
+    if expired:
+        logger.info(f"Purged {len(expired)} expired session(s)")
+    _last_session_cleanup = now
+
 
 class SAMLAuth:
     """SAML Authentication handler"""
@@ -178,36 +218,17 @@ class SAMLAuth:
         Extract user data from SAML attributes
         Handles Microsoft-specific attribute names
         """
-        # Microsoft attribute mappings
-        email = (
-            nameid
-            or self._get_attribute(
-                attributes,
-                "http://schemas.xmlsoap.org/ws/2005/05/identity/claims/emailaddress",
-            )
-            or self._get_attribute(attributes, "email")
-            or self._get_attribute(attributes, "mail")
-        )
-
-        given_name = self._get_attribute(
-            attributes,
-            "http://schemas.xmlsoap.org/ws/2005/05/identity/claims/givenname",
-            "givenname",
-            "firstname",
-        )
-
-        surname = self._get_attribute(
-            attributes,
-            "http://schemas.xmlsoap.org/ws/2005/05/identity/claims/surname",
-            "surname",
-            "lastname",
-        )
+        # Microsoft attribute mappings; an empty email claim falls through to the next name
+        email = nameid
+        if not email:
+            for key in _EMAIL_CLAIMS:
+                email = self._get_attribute(attributes, key)
+                if email:
+                    break
 
-        groups = self._get_attribute(
-            attributes,
-            "http://schemas.microsoft.com/ws/2008/06/identity/claims/groups",
-            "groups",
-        )
+        given_name = self._get_attribute(attributes, *_GIVEN_NAME_CLAIMS)
+        surname = self._get_attribute(attributes, *_SURNAME_CLAIMS)
+        groups = self._get_attribute(attributes, *_GROUPS_CLAIMS)
 
         if not email:
             raise HTTPException(
@@ -235,10 +256,10 @@ class SAMLAuth:
         Handles both single values and lists
         """
         for key in keys:
-            if key in attributes:
-                value = attributes[key]
+            value = attributes.get(key)
+            if value is not None:
                 # If it's a list, return first element
-                if isinstance(value, list) and len(value) > 0:
+                if isinstance(value, list) and value:
                     return value[0]
                 return value
         return None
@@ -270,11 +291,12 @@ class SAMLAuth:
         Store session data
         In production, use Redis or similar
         """
+        now = datetime.utcnow()
+        _purge_expired_sessions(now)
         _sessions[session_token] = {
             "user_data": user_data,
-            "created_at": datetime.utcnow(),
-            "expires_at": datetime.utcnow()
-            + timedelta(seconds=settings.SESSION_LIFETIME_SECONDS),
+            "created_at": now,
+            "expires_at": now + timedelta(seconds=settings.SESSION_LIFETIME_SECONDS),
         }
 
         logger.info(f"Session created for user: {user_data['email']}, token: {session_token[:16]}..., total sessions: {len(_sessions)}")
@@ -286,12 +308,11 @@ class SAMLAuth:
         """
         logger.debug(f"Looking up session token: {session_token[:16]}... (total sessions: {len(_sessions)})")
 
-        if session_token not in _sessions:
-            logger.warning(f"Session token not found in store. Available tokens: {[t[:16] for t in _sessions.keys()]}")
+        session = _sessions.get(session_token)
+        if session is None:
+            logger.warning(f"Session token not found in store (total sessions: {len(_sessions)})")
             return None
 
-        session = _sessions[session_token]
-
         # Check expiration
         if datetime.utcnow() > session["expires_at"]:
             del _sessions[session_token]
@@ -303,8 +324,7 @@ class SAMLAuth:
 
     def delete_session(self, session_token: str):
         """Delete session"""
-        if session_token in _sessions:
-            del _sessions[session_token]
+        if _sessions.pop(session_token, None) is not None:
             logger.info("Session deleted")
 
 
@@ -0,0 +1,16 @@
+"""
+ETag helpers for conditional GET endpoints.
+"""
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Weak comparison of an If-None-Match header against an ETag.
+
+    Accepts a comma-separated list of tags, W/ weak forms and "*", as
+    RFC 9110 requires for If-None-Match.
+    """
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag.removeprefix("W/") in tags
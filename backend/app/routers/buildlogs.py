@@ -1,15 +1,22 @@
 """
 Build logs endpoints
 """
+import asyncio
+import os
 import re
+import stat
+import string
+from functools import lru_cache
 from pathlib import Path
-from fastapi import APIRouter, Depends, HTTPException, Response, status
-from fastapi.responses import PlainTextResponse
+from typing import AsyncIterator, BinaryIO
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
 import logging
 
 from app.models import User
 from app.auth import get_current_user
-from app.config import settings
+from app.config import Settings, settings
+from app.etag import etag_matches
 from app.logger import buildlogs_logger
 
 # Use dedicated buildlogs logger for detailed debugging
@@ -17,6 +24,118 @@ logger = buildlogs_logger
 router = APIRouter()
 
 MAX_LOG_SIZE = 10 * 1024 * 1024  # 10MB limit
+LOG_CHUNK_SIZE = 64 * 1024  # Bytes read per worker-thread hop when streaming a log
+
+
+# Fast path for the default HOSTNAME_PATTERN (^[a-zA-Z0-9._-]+$): deleting every
+# allowed character with str.translate leaves an empty string iff the hostname is valid
+DEFAULT_HOSTNAME_PATTERN = Settings.model_fields["HOSTNAME_PATTERN"].default
+_STRIP_DEFAULT_HOSTNAME_CHARS = str.maketrans("", "", string.ascii_letters + string.digits + "._-")
+
+# Never valid in a hostname, whatever HOSTNAME_PATTERN allows
+_PATH_TRAVERSAL_TOKENS = ("..", "/", "\\", "\x00")
+
+
+@lru_cache(maxsize=None)
+def _compile_hostname_pattern(pattern: str) -> re.Pattern:
+    """Compile HOSTNAME_PATTERN once per distinct pattern string"""
+    return re.compile(pattern)
+
+
+def _dir_cache_key(directory: Path) -> tuple:
+    """
+    Cache key for a directory's entries. nlink is included alongside mtime_ns
+    because coarse-timestamp filesystems (NFS, some CIFS mounts) can leave the
+    mtime unchanged when a subdirectory is added in the same tick.
+    """
+    st = directory.stat()
+    return (directory, st.st_mtime_ns, st.st_nlink)
+
+
+# Sorted build_server subdirectories of BUILD_LOGS_DIR, keyed by the directory's
+# (path, mtime_ns, nlink) so adding or removing a build server invalidates it.
+# Stored as one (key, value) tuple so worker threads swap it atomically.
+_build_server_dirs_cache: tuple = (None, ())
+
+
+def _list_build_server_dirs(base_dir: Path) -> tuple[Path, ...]:
+    """Return build_server subdirectories sorted by name, rescanning only on change"""
+    global _build_server_dirs_cache
+    key = _dir_cache_key(base_dir)
+    cached_key, dirs = _build_server_dirs_cache
+    if cached_key != key:
+        # DirEntry.is_dir() uses the d_type from readdir, so only symlinks need a stat.
+        # Sort for deterministic first-match behavior
+        with os.scandir(base_dir) as entries:
+            dirs = tuple(sorted(Path(entry.path) for entry in entries if entry.is_dir()))
+        _build_server_dirs_cache = (key, dirs)
+    return dirs
+
+
+# hostname -> [(build_server_name, hostname_dir_path)] for every build server that has a
+# directory for that hostname, in build server order. Keyed by the build server
+# list and each build server directory's (mtime_ns, nlink), so new or removed hostname
+# directories invalidate it.
+_hostname_index_cache: tuple = (None, {})
+
+
+def _hostname_index(build_server_dirs: tuple[Path, ...]) -> dict[str, list[tuple[str, str]]]:
+    """Return the hostname -> candidate directories index, rescanning only on change"""
+    global _hostname_index_cache
+    try:
+        key = tuple(_dir_cache_key(d) for d in build_server_dirs)
+    except OSError:
+        key = None  # A build server vanished mid-request; rebuild from what remains
+    cached_key, index = _hostname_index_cache
+    if key is None or cached_key != key:
+        index = {}
+        for build_server_dir in build_server_dirs:
+            try:
+                with os.scandir(build_server_dir) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            index.setdefault(entry.name, []).append(
+                                (build_server_dir.name, entry.path)
+                            )
+            except OSError:
+                logger.warning(f"Could not scan build server directory: {build_server_dir}")
+        _hostname_index_cache = (key, index)
+    return index
+
+
+def prime_build_log_caches() -> int:
+    """
+    Build the build server listing and hostname index ahead of the first request.
+
+    Returns:
+        Number of hostname directories indexed
+    """
+    base_dir = Path(settings.BUILD_LOGS_DIR).resolve()
+    return len(_hostname_index(_list_build_server_dirs(base_dir)))
+
+
+def _log_etag(file_stat: os.stat_result) -> str:
+    """Weak ETag for a log file from its modification time and size"""
+    return f'W/"{file_stat.st_mtime_ns:x}-{file_stat.st_size:x}"'
+
+
+async def _stream_log_snapshot(log_fh: BinaryIO, size: int) -> AsyncIterator[bytes]:
+    """
+    Yield the first size bytes of an open log file in chunks, reading off the event loop.
+
+    Stopping at size means bytes a running build appends later can't outgrow the
+    Content-Length already sent. Closes the file when done.
+    """
+    try:
+        remaining = size
+        while remaining > 0:
+            chunk = await asyncio.to_thread(log_fh.read, min(LOG_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+    finally:
+        log_fh.close()
 
 
 def sanitize_hostname(hostname: str) -> str:
@@ -32,11 +151,22 @@ def sanitize_hostname(hostname: str) -> str:
 
     logger.debug(f"[BUILDLOG] ✓ Length check passed ({len(hostname)} chars)")
 
-    # Compile pattern from config
-    hostname_pattern = re.compile(settings.HOSTNAME_PATTERN)
+    # Reject path separators/parent references before the pattern or any filesystem access
+    if any(token in hostname for token in _PATH_TRAVERSAL_TOKENS):
+        logger.warning(f"Path traversal attempt in hostname: {hostname!r}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid hostname: path separators and '..' are not allowed"
+        )
+
     logger.debug(f"[BUILDLOG] Using pattern: {settings.HOSTNAME_PATTERN}")
+    if settings.HOSTNAME_PATTERN == DEFAULT_HOSTNAME_PATTERN:
+        valid = not hostname.translate(_STRIP_DEFAULT_HOSTNAME_CHARS)
+    else:
+        # Compiled pattern from config (cached by pattern string)
+        valid = _compile_hostname_pattern(settings.HOSTNAME_PATTERN).match(hostname) is not None
 
-    if not hostname_pattern.match(hostname):
+    if not valid:
         logger.warning(f"Invalid hostname format attempted: {hostname}")
         logger.debug(f"[BUILDLOG] ✗ Hostname validation failed - invalid characters")
         raise HTTPException(
@@ -48,7 +178,7 @@ def sanitize_hostname(hostname: str) -> str:
     return hostname
 
 
-def get_log_file_path(hostname: str) -> tuple[Path, str]:
+def get_log_file_path(hostname: str) -> tuple[Path, str, os.stat_result]:
     """
     Get and validate log file path in nested directory structure.
 
@@ -58,7 +188,8 @@ def get_log_file_path(hostname: str) -> tuple[Path, str]:
         hostname: Server hostname to search for
 
     Returns:
-        Tuple of (log_file_path, build_server_name)
+        Tuple of (log_file_path, build_server_name, stat_result of the log file).
+        The stat is for the size limit and ETag only; the file may grow after it.
 
     Raises:
         HTTPException: If logs dir not configured, hostname invalid, or log not found
@@ -74,6 +205,10 @@ def get_log_file_path(hostname: str) -> tuple[Path, str]:
 
     sanitized = sanitize_hostname(hostname)
     base_dir = Path(settings.BUILD_LOGS_DIR).resolve()
+    # Candidates are checked with plain string operations; the trailing separator
+    # keeps a sibling like /logs-old from passing as inside /logs
+    base_prefix = os.path.join(str(base_dir), "")
+    log_file_name = sanitized + "-Installer.log"
 
     # Check base directory exists and is accessible
     if not base_dir.exists():
@@ -83,9 +218,9 @@ def get_log_file_path(hostname: str) -> tuple[Path, str]:
             detail=f"Build log not found for hostname: {hostname}"
         )
 
-    # Get all build_server subdirectories
+    # Get all build_server subdirectories (sorted, cached until the directory changes)
     try:
-        build_server_dirs = [d for d in base_dir.iterdir() if d.is_dir()]
+        build_server_dirs = _list_build_server_dirs(base_dir)
     except PermissionError:
         logger.error(f"Permission denied reading build logs directory: {base_dir}")
         raise HTTPException(
@@ -93,45 +228,46 @@ def get_log_file_path(hostname: str) -> tuple[Path, str]:
             detail="Permission denied reading build logs directory"
         )
 
-    # Sort for deterministic first-match behavior
-    build_server_dirs.sort()
     build_servers = [d.name for d in build_server_dirs]
 
     logger.debug(f"[BUILDLOG] Found {len(build_servers)} build server(s): {build_servers}")
     logger.debug("[BUILDLOG] Searching for log file...")
     logger.debug("-" * 80)
 
-    # Search for hostname in each build_server directory
-    for build_server_dir in build_server_dirs:
-        build_server_name = build_server_dir.name
+    # Only build servers that have a {hostname} directory can hold the log
+    candidates = _hostname_index(build_server_dirs).get(sanitized, [])
+    logger.debug(f"[BUILDLOG] Build server(s) with a '{sanitized}' directory: {[c[0] for c in candidates]}")
 
+    for build_server_name, hostname_dir in candidates:
         logger.debug(f"[BUILDLOG] Checking build server: {build_server_name}")
 
         # Construct expected path: {build_server}/{hostname}/{hostname}-Installer.log
-        candidate_path = build_server_dir / sanitized / f"{sanitized}-Installer.log"
+        candidate_path = hostname_dir + os.sep + log_file_name
         logger.debug(f"[BUILDLOG]   Candidate path: {candidate_path}")
 
         # Resolve path and security check
-        try:
-            resolved_path = candidate_path.resolve()
-            logger.debug(f"[BUILDLOG]   Resolved path: {resolved_path}")
-
-            # Security: Ensure resolved path is within BUILD_LOGS_DIR
-            resolved_path.relative_to(base_dir)
-            logger.debug(f"[BUILDLOG]   ✓ Path is within BUILD_LOGS_DIR")
-        except (ValueError, RuntimeError):
-            # Path traversal attempt or resolution error - skip this candidate
+        resolved_path = os.path.realpath(candidate_path)
+        logger.debug(f"[BUILDLOG]   Resolved path: {resolved_path}")
+
+        # Security: Ensure resolved path is within BUILD_LOGS_DIR
+        if not resolved_path.startswith(base_prefix):
+            # Path traversal attempt (e.g. a symlink out of the tree) - skip this candidate
             logger.warning(f"Path resolution failed for {candidate_path}")
             logger.debug(f"[BUILDLOG]   ✗ Path resolution failed (security violation)")
             continue
+        logger.debug(f"[BUILDLOG]   ✓ Path is within BUILD_LOGS_DIR")
 
-        # Check if file exists and is a regular file
-        if resolved_path.exists() and resolved_path.is_file():
+        # Check if file exists and is a regular file (one stat, reused for the size check)
+        try:
+            file_stat = os.stat(resolved_path)
+        except OSError:
+            continue
+        if stat.S_ISREG(file_stat.st_mode):
             logger.info(f"Found log for {hostname} in build_server: {build_server_name}")
             logger.debug(f"[BUILDLOG] ✓ Log file found in build server: {build_server_name}")
             logger.debug(f"[BUILDLOG]   File path: {resolved_path}")
             logger.debug("-" * 80)
-            return (resolved_path, build_server_name)
+            return (Path(resolved_path), build_server_name, file_stat)
 
     # No match found in any build_server directory
     logger.info(f"Build log not found for hostname: {hostname}")
@@ -154,6 +290,7 @@ def get_log_file_path(hostname: str) -> tuple[Path, str]:
 )
 async def get_build_log(
     hostname: str,
+    request: Request,
     current_user: User = Depends(get_current_user),
 ) -> Response:
     """Get build log content for a specific hostname"""
@@ -170,10 +307,12 @@ async def get_build_log(
         logger.debug("-" * 80)
 
         # Get log file path and build server name
-        log_file, build_server = get_log_file_path(hostname)
+        # Directory scans and stats block, so run discovery in a worker thread
+        log_file, build_server, file_stat = await asyncio.to_thread(get_log_file_path, hostname)
 
-        # Check file size
-        file_size = log_file.stat().st_size
+        # The discovery stat only feeds the size limit and the ETag. It can be stale by
+        # the time the file is read, so the body is sized from the bytes actually read
+        file_size = file_stat.st_size
         logger.debug(f"[BUILDLOG] File size: {file_size:,} bytes ({file_size / 1024 / 1024:.2f} MB)")
         logger.debug(f"[BUILDLOG] Size limit: {MAX_LOG_SIZE:,} bytes ({MAX_LOG_SIZE / 1024 / 1024:.0f} MB)")
 
@@ -189,49 +328,18 @@ async def get_build_log(
 
         logger.debug(f"[BUILDLOG] ✓ File size within limits")
 
-        # Read file content
-        try:
-            logger.debug(f"[BUILDLOG] Reading file with UTF-8 encoding...")
-            logger.debug(f"[BUILDLOG] File: {log_file}")
-
-            with open(log_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            logger.debug(f"[BUILDLOG] ✓ File read successful")
-            logger.debug(f"[BUILDLOG] Content length: {len(content):,} characters")
-            # Use repr to escape newlines in preview
-            content_preview = repr(content[:100])
-            logger.debug(f"[BUILDLOG] Content preview (first 100 chars): {content_preview}")
-
-            # Return response with custom header
-            logger.info(
-                f"Returning log for {hostname} from build_server: {build_server} "
-                f"({file_size} bytes)"
-            )
-
-            logger.debug("=" * 80)
-            logger.debug("BUILD LOG RESPONSE SUMMARY")
-            logger.debug("-" * 80)
-            logger.debug(f"Status: 200 OK")
-            logger.debug(f"Build Server: {build_server}")
-            logger.debug(f"File Path: {log_file}")
-            logger.debug(f"File Size: {file_size:,} bytes")
-            logger.debug(f"Content Type: text/plain; charset=utf-8")
-            logger.debug(f"X-Build-Server Header: {build_server}")
-            logger.debug("=" * 80)
+        # Unchanged since the client's copy: no body needed
+        etag = _log_etag(file_stat)
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            logger.debug(f"[BUILDLOG] ✓ If-None-Match matches {etag}, returning 304")
             return Response(
-                content=content,
-                media_type="text/plain; charset=utf-8",
-                headers={"X-Build-Server": build_server}
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": etag, "X-Build-Server": build_server},
             )
 
-        except UnicodeDecodeError:
-            logger.error(f"Build log encoding error: {hostname} in {build_server}")
-            logger.debug(f"[BUILDLOG] ✗ UTF-8 decoding failed")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Build log file is not valid UTF-8"
-            )
+        # Open before responding so an unreadable file still maps to a 500
+        try:
+            log_fh = await asyncio.to_thread(open, log_file, "rb")
         except PermissionError:
             logger.error(f"Permission denied reading build log: {hostname} in {build_server}")
             logger.debug(f"[BUILDLOG] ✗ Permission denied reading file")
@@ -240,6 +348,35 @@ async def get_build_log(
                 detail="Permission denied reading build log"
             )
 
+        # Return response with custom header
+        logger.info(
+            f"Returning log for {hostname} from build_server: {build_server} "
+            f"({file_size} bytes)"
+        )
+
+        logger.debug("=" * 80)
+        logger.debug("BUILD LOG RESPONSE SUMMARY")
+        logger.debug("-" * 80)
+        logger.debug(f"Status: 200 OK")
+        logger.debug(f"Build Server: {build_server}")
+        logger.debug(f"File Path: {log_file}")
+        logger.debug(f"File Size: {file_size:,} bytes")
+        logger.debug(f"Content Type: text/plain; charset=utf-8")
+        logger.debug(f"X-Build-Server Header: {build_server}")
+        logger.debug("=" * 80)
+
+        # Installer logs grow while a build runs, so stream a snapshot of the size
+        # that was checked, with Content-Length fixed to that size
+        return StreamingResponse(
+            _stream_log_snapshot(log_fh, file_size),
+            media_type="text/plain; charset=utf-8",
+            headers={
+                "Content-Length": str(file_size),
+                "ETag": etag,
+                "X-Build-Server": build_server,
+            },
+        )
+
     except HTTPException:
         raise
     except Exception as e:
@@ -3,12 +3,16 @@ Config endpoint for region/rack/build-server mappings
 Returns configuration data from config.json
 """
 
+import hashlib
 import json
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, Response, status
+
+from app.etag import etag_matches
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -19,6 +23,13 @@ CONFIG_EXAMPLE_PATH = Path(__file__).parent.parent.parent / "config" / "config.j
 
 _config: Dict[str, Any] = {}
 
+# Clients may reuse /config for a minute before revalidating with If-None-Match
+CONFIG_CACHE_CONTROL = "public, max-age=60"
+
+# Serialized /config response body and its ETag, built at startup or on first request
+_config_body: Optional[bytes] = None
+_config_etag: Optional[str] = None
+
 
 def _load_config() -> Dict[str, Any]:
     """Load regions config from JSON file, with fallback to config.json.example"""
@@ -48,6 +59,41 @@ def get_config() -> Dict[str, Any]:
     return _load_config()
 
 
+@lru_cache(maxsize=1)
+def _build_server_index() -> Tuple[Dict[str, Tuple[str, ...]], Dict[str, str]]:
+    """
+    Build region -> build servers and build server -> region lookups once.
+
+    Returns:
+        Tuple of (servers_by_region, region_by_server)
+    """
+    servers_by_region: Dict[str, Tuple[str, ...]] = {}
+    region_by_server: Dict[str, str] = {}
+    for region_code, region_config in get_config().get("regions", {}).items():
+        build_servers = tuple(region_config.get("build_servers", {}))
+        servers_by_region[region_code] = build_servers
+        for build_server in build_servers:
+            # First region listing a server wins, matching config order
+            region_by_server.setdefault(build_server, region_code)
+    return servers_by_region, region_by_server
+
+
+def _get_config_body() -> Tuple[bytes, str]:
+    """Serialize the config once and return (JSON body, strong ETag)"""
+    global _config_body, _config_etag
+    if _config_body is None:
+        body = json.dumps(get_config(), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        _config_etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        _config_body = body
+    return _config_body, _config_etag
+
+
+def prime_config_cache() -> int:
+    """Serialize the /config response ahead of the first request; returns body size"""
+    body, _ = _get_config_body()
+    return len(body)
+
+
 def get_appliance_sizes() -> List[str]:
     """Get the list of valid appliance sizes from config"""
     config = get_config()
@@ -65,11 +111,8 @@ def get_build_servers_for_region(region: str) -> List[str]:
     Returns:
         List of build server hostnames for the region
     """
-    config = get_config()
-    regions = config.get("regions", {})
-    region_config = regions.get(region, {})
-    build_servers = region_config.get("build_servers", {})
-    return list(build_servers.keys())
+    servers_by_region, _ = _build_server_index()
+    return list(servers_by_region.get(region, ()))
 
 
 def get_build_server_config(region: str) -> Dict[str, Dict[str, Any]]:
@@ -98,31 +141,32 @@ def get_region_for_build_server(build_server: str) -> Optional[str]:
     Returns:
         Region code (cbg, dub, dal) or None if not found
     """
-    config = get_config()
-    regions = config.get("regions", {})
-
-    for region_code, region_config in regions.items():
-        build_servers = region_config.get("build_servers", {})
-        if build_server in build_servers:
-            return region_code
-
-    return None
+    _, region_by_server = _build_server_index()
+    return region_by_server.get(build_server)
 
 
 @router.get(
     "/config",
     summary="Get regions configuration",
     description="Returns the full regions configuration including build servers and racks",
+    response_class=Response,
 )
-async def get_regions_config() -> Dict[str, Any]:
+async def get_regions_config(request: Request) -> Response:
     """
     Get the full regions configuration.
     Returns build servers and rack mappings for all regions.
     This endpoint is public and does not require authentication.
+    The config is static, so the serialized body is cached and served with an
+    ETag and a short Cache-Control lifetime; a matching If-None-Match gets an
+    empty 304.
     """
     try:
         logger.info("Config requested")
-        return get_config()
+        body, etag = _get_config_body()
+        headers = {"ETag": etag, "Cache-Control": CONFIG_CACHE_CONTROL}
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
     except Exception as e:
         logger.error(f"Error fetching config: {str(e)}")
         raise HTTPException(
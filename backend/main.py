@@ -8,6 +8,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import RedirectResponse
 from contextlib import asynccontextmanager
 from datetime import datetime
+import json
 import secrets
 import time
 
@@ -108,6 +109,12 @@ async def lifespan(app: FastAPI):
                         f"  ... and {len(entries) - 3} more build server(s)"
                     )
 
+                # Sort build servers and index hostnames now rather than on the first request
+                from app.routers.buildlogs import prime_build_log_caches
+
+                hostname_count = prime_build_log_caches()
+                buildlogs_logger.info(f"Indexed {hostname_count} hostname directories")
+
             except PermissionError as e:
                 buildlogs_logger.error(
                     f"Permission denied reading BUILD_LOGS_DIR: {settings.BUILD_LOGS_DIR}"
@@ -120,6 +127,11 @@ async def lifespan(app: FastAPI):
         from app.logger import buildlogs_logger
         buildlogs_logger.warning("BUILD_LOGS_DIR not configured")
 
+    # Serialize the static /api/config body once at startup
+    from app.routers.config import prime_config_cache
+
+    app_logger.info(f"Config response cached ({prime_config_cache()} bytes)")
+
     yield
 
     # Cleanup on shutdown
@@ -129,10 +141,12 @@ async def lifespan(app: FastAPI):
     app_logger.info("Shutting down Server Building Dashboard Backend")
 
 
+API_VERSION = "1.0.0"
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Server Building Dashboard API",
-    version="1.0.0",
+    version=API_VERSION,
     description="API for server build monitoring and management",
     lifespan=lifespan,
     docs_url="/api/docs" if settings.ENVIRONMENT == "dev" else None,
@@ -203,15 +217,31 @@ app.include_router(buildlogs.router, prefix="/api", tags=["buildlogs"])
 app.include_router(config.router, prefix="/api", tags=["config"])
 
 
-# Health check endpoint
-@app.get("/api/health", tags=["health"])
+# Health check endpoint: only the timestamp varies, so the rest of the JSON is prebuilt
+_HEALTH_PREFIX = b'{"status":"healthy","version":"' + API_VERSION.encode() + b'","timestamp":"'
+_HEALTH_SUFFIX = b'"}'
+
+# Liveness probes don't need sub-second timestamps: reuse the body for up to a second
+_HEALTH_BODY_TTL = 1.0
+_health_body_cache: tuple = (float("-inf"), b"")
+
+
+def _health_body() -> bytes:
+    """Return the health JSON body, re-rendering its timestamp at most once per second"""
+    global _health_body_cache
+    now = time.monotonic()
+    built_at, body = _health_body_cache
+    if now - built_at >= _HEALTH_BODY_TTL:
+        timestamp = datetime.utcnow().isoformat().encode()
+        body = _HEALTH_PREFIX + timestamp + _HEALTH_SUFFIX
+        _health_body_cache = (now, body)
+    return body
+
+
+@app.get("/api/health", tags=["health"], response_class=Response)
 async def health_check():
     """Health check endpoint for monitoring"""
-    return {
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
-        "version": "1.0.0",
-    }
+    return Response(content=_health_body(), media_type="application/json")
 
 
 # Authentication endpoints
@@ -338,15 +368,17 @@ async def logout(
     return {"status": "success", "message": "Logged out successfully"}
 
 
-# Root endpoint
-@app.get("/api", tags=["root"])
+# Root endpoint: fully static, so the body is serialized once at import
+_ROOT_BYTES = json.dumps(
+    {"name": "Server Building Dashboard API", "version": API_VERSION, "status": "running"},
+    separators=(",", ":"),
+).encode()
+
+
+@app.get("/api", tags=["root"], response_class=Response)
 async def root():
     """Root endpoint"""
-    return {
-        "name": "Server Building Dashboard API",
-        "version": "1.0.0",
-        "status": "running",
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 
 if __name__ == "__main__":
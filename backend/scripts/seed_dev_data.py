@@ -10,6 +10,7 @@ Usage:
     python scripts/seed_dev_data.py --append     # Append mode: add records without clearing
     python scripts/seed_dev_data.py --count 30   # Custom record count
     python scripts/seed_dev_data.py --today-only # Only seed today's data (no historical)
+    python scripts/seed_dev_data.py --seed 42    # Reproducible random values (reset mode only)
 """
 import argparse
 import asyncio
@@ -19,7 +20,9 @@ import random
 import sys
 import uuid
 from datetime import datetime, timedelta
+from itertools import cycle, islice
 from pathlib import Path
+from typing import Iterable, Iterator, Optional
 
 # Add parent directory to path so we can import app modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -40,6 +43,8 @@ def load_config() -> dict:
     return {}
 
 from sqlalchemy import delete, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.database import get_db_context, init_db
 from app.db.models import BuildHistoryDB, BasedDB, PreconfigDB
 
@@ -74,9 +79,22 @@ REGIONS = {
     },
 }
 
+# Per-region fields the generators need, flattened once so the hot loops can
+# cycle over them: (region, racks, build_server, ip_prefix, depot_id)
+REGION_ROWS = [
+    (region, cfg["racks"], cfg["build_server"], cfg["ip_prefix"], cfg["depot_id"])
+    for region, cfg in REGIONS.items()
+]
+
+# Rows per INSERT executemany when seeding; bounds memory for large --count runs
+INSERT_CHUNK_SIZE = 10_000
+
 # Configuration options for realistic data
 BUILD_STATUSES = ["installing", "complete", "failed"]
 BUILD_STATUS_WEIGHTS = [0.4, 0.5, 0.1]  # 40% installing, 50% complete, 10% failed
+YESTERDAY_BUILD_STATUSES = ["complete", "failed"]
+FINISHED_BUILD_STATUSES = frozenset(["complete", "failed"])  # Statuses that get a build_end
+YESTERDAY_BUILD_STATUS_WEIGHTS = [0.85, 0.15]  # Yesterday's builds have all finished
 
 ASSIGNED_STATUSES = ["assigned", "not assigned"]
 MACHINE_TYPES = ["Server", "Storage", "Network"]
@@ -115,20 +133,25 @@ SAMPLE_USERS = [
 # Helper Functions for Generating Realistic Data
 # =============================================================================
 
-def generate_serial() -> str:
+def generate_serial(rng: random.Random) -> str:
     """Generate an 8-digit serial number."""
-    return str(random.randint(10000000, 99999999))
+    return str(rng.randint(10000000, 99999999))
 
 
-def generate_mac() -> str:
-    """Generate a random MAC address."""
-    return ":".join(f"{random.randint(0, 255):02X}" for _ in range(6))
+def generate_uuids(rng: random.Random, count: int) -> Iterator[str]:
+    """Yield `count` UUID4 strings from a single random byte draw."""
+    raw = rng.randbytes(16 * count)
+    _UUID = uuid.UUID
+    for i in range(0, 16 * count, 16):
+        yield str(_UUID(bytes=raw[i:i + 16], version=4))
 
 
-def generate_ip(region: str, host_num: int) -> str:
-    """Generate an IP address based on region subnet."""
-    prefix = REGIONS[region]["ip_prefix"]
-    return f"{prefix}.{host_num}"
+def generate_macs(rng: random.Random, count: int) -> Iterator[str]:
+    """Yield `count` random MAC addresses, one 48-bit draw per address."""
+    _getrandbits = rng.getrandbits
+    for _ in range(count):
+        h = f"{_getrandbits(48):012X}"
+        yield f"{h[0:2]}:{h[2:4]}:{h[4:6]}:{h[6:8]}:{h[8:10]}:{h[10:12]}"
 
 
 def generate_hostname(region: str, idx: int) -> str:
@@ -142,30 +165,29 @@ def generate_dbid(region: str, idx: int) -> str:
     return f"{depot}{idx:05d}"
 
 
-def random_datetime_today(hours_ago_max: int = 8) -> datetime:
-    """Generate a random datetime within today."""
-    now = datetime.utcnow()
-    hours_ago = random.uniform(0, hours_ago_max)
+def random_datetime_today(rng: random.Random, now: datetime, hours_ago_max: int = 8) -> datetime:
+    """Generate a random datetime up to `hours_ago_max` hours before `now`."""
+    hours_ago = rng.uniform(0, hours_ago_max)
     return now - timedelta(hours=hours_ago)
 
 
-def random_datetime_yesterday() -> datetime:
-    """Generate a random datetime from yesterday."""
-    now = datetime.utcnow()
+def random_datetime_yesterday(rng: random.Random, now: datetime) -> datetime:
+    """Generate a random datetime from the day before `now`."""
     yesterday = now - timedelta(days=1)
-    hours_offset = random.uniform(0, 24)
+    hours_offset = rng.uniform(0, 24)
     return yesterday.replace(hour=0, minute=0, second=0) + timedelta(hours=hours_offset)
 
 
-def generate_config() -> dict:
+def generate_config(rng: random.Random) -> dict:
     """Generate a realistic server configuration."""
+    _choice = rng.choice
     return {
-        "os": random.choice(OS_OPTIONS),
-        "cpu": random.choice(CPU_OPTIONS),
-        "ram": random.choice(RAM_OPTIONS),
-        "storage": random.choice(STORAGE_OPTIONS),
-        "raid": random.choice(RAID_OPTIONS),
-        "network": random.choice(NETWORK_OPTIONS),
+        "os": _choice(OS_OPTIONS),
+        "cpu": _choice(CPU_OPTIONS),
+        "ram": _choice(RAM_OPTIONS),
+        "storage": _choice(STORAGE_OPTIONS),
+        "raid": _choice(RAID_OPTIONS),
+        "network": _choice(NETWORK_OPTIONS),
     }
 
 
@@ -173,251 +195,243 @@ def generate_config() -> dict:
 # Data Generation Functions
 # =============================================================================
 
-def generate_build_history_records(count: int, include_yesterday: bool = True) -> list[BuildHistoryDB]:
-    """Generate build_history records distributed across regions and dates."""
-    records = []
-    regions = list(REGIONS.keys())
+def generate_build_history_records(
+    count: int, include_yesterday: bool = True, seed: Optional[int | str] = None
+) -> Iterator[dict]:
+    """Yield build_history rows (keyed by column name) distributed across regions and dates."""
+    # Private generator (reproducible with `seed`); bind its methods to locals for the hot loop
+    rng = random.Random(seed)
+    _choice = rng.choice
+    _choices = rng.choices
+    _randint = rng.randint
+    _uniform = rng.uniform
+    _random = rng.random
+    _td = timedelta
+    # Capture the clock once; per-row jitter is drawn around it
+    now = datetime.utcnow()
 
     # Split count between today and yesterday if applicable
     today_count = count if not include_yesterday else int(count * 0.6)
     yesterday_count = count - today_count if include_yesterday else 0
 
-    idx = 1
+    # One entry per date phase:
+    # (count, date_fn, build_start_args, assigned_at_args, statuses, weights,
+    #  failed_percent_range, assign_threshold, build_hours_range)
+    # Yesterday's builds are mostly complete and have all finished.
+    phases = [
+        (today_count, random_datetime_today, (8,), (2,),
+         BUILD_STATUSES, BUILD_STATUS_WEIGHTS, (10, 90), 0.3, (0.5, 3)),
+        (yesterday_count, random_datetime_yesterday, (), (),
+         YESTERDAY_BUILD_STATUSES, YESTERDAY_BUILD_STATUS_WEIGHTS, (20, 80), 0.2, (1, 4)),
+    ]
+
+    uuids = generate_uuids(rng, today_count + yesterday_count)
+    macs = generate_macs(rng, today_count + yesterday_count)
     used_serials = set()
 
-    # Generate today's records
-    for i in range(today_count):
-        region = regions[i % len(regions)]
-        config = REGIONS[region]
-
-        # Generate unique serial
-        serial = generate_serial()
-        while serial in used_serials:
-            serial = generate_serial()
-        used_serials.add(serial)
-
-        # Determine build status and percent
-        status = random.choices(BUILD_STATUSES, weights=BUILD_STATUS_WEIGHTS)[0]
-        if status == "complete":
-            percent = 100
-        elif status == "failed":
-            percent = random.randint(10, 90)
-        else:  # installing
-            percent = random.randint(5, 95)
-
-        # Determine assignment (only complete builds can be assigned)
-        assigned_status = "not assigned"
-        assigned_by = None
-        assigned_at = None
-        if status == "complete" and random.random() > 0.3:
-            assigned_status = "assigned"
-            assigned_by = random.choice(SAMPLE_USERS)
-            assigned_at = random_datetime_today(2)
-
-        build_start = random_datetime_today(8)
-        build_end = None
-        if status in ["complete", "failed"]:
-            build_end = build_start + timedelta(hours=random.uniform(0.5, 3))
-
-        records.append(BuildHistoryDB(
-            uuid=str(uuid.uuid4()),
-            hostname=generate_hostname(region, idx),
-            rack_id=random.choice(config["racks"]),
-            dbid=generate_dbid(region, idx),
-            serial_number=serial,
-            machine_type=random.choice(MACHINE_TYPES),
-            bundle=random.choice(BUNDLES),
-            ip_address=generate_ip(region, 100 + idx),
-            mac_address=generate_mac(),
-            build_server=config["build_server"],
-            percent_built=percent,
-            build_status=status,
-            assigned_status=assigned_status,
-            build_start=build_start,
-            build_end=build_end,
-            assigned_by=assigned_by,
-            assigned_at=assigned_at,
-        ))
-        idx += 1
-
-    # Generate yesterday's records (mostly complete)
-    for i in range(yesterday_count):
-        region = regions[i % len(regions)]
-        config = REGIONS[region]
-
-        serial = generate_serial()
-        while serial in used_serials:
-            serial = generate_serial()
-        used_serials.add(serial)
-
-        # Yesterday's builds are mostly complete
-        status = random.choices(["complete", "failed"], weights=[0.85, 0.15])[0]
-        percent = 100 if status == "complete" else random.randint(20, 80)
-
-        assigned_status = "not assigned"
-        assigned_by = None
-        assigned_at = None
-        if status == "complete" and random.random() > 0.2:
-            assigned_status = "assigned"
-            assigned_by = random.choice(SAMPLE_USERS)
-            assigned_at = random_datetime_yesterday()
-
-        build_start = random_datetime_yesterday()
-        build_end = build_start + timedelta(hours=random.uniform(1, 4))
-
-        records.append(BuildHistoryDB(
-            uuid=str(uuid.uuid4()),
-            hostname=generate_hostname(region, idx),
-            rack_id=random.choice(config["racks"]),
-            dbid=generate_dbid(region, idx),
-            serial_number=serial,
-            machine_type=random.choice(MACHINE_TYPES),
-            bundle=random.choice(BUNDLES),
-            ip_address=generate_ip(region, 100 + idx),
-            mac_address=generate_mac(),
-            build_server=config["build_server"],
-            percent_built=percent,
-            build_status=status,
-            assigned_status=assigned_status,
-            build_start=build_start,
-            build_end=build_end,
-            assigned_by=assigned_by,
-            assigned_at=assigned_at,
-        ))
-        idx += 1
-
-    return records
-
-
-def generate_based_records(count: int, include_yesterday: bool = True) -> list[BasedDB]:
-    """Generate based table records."""
-    records = []
-    regions = list(REGIONS.keys())
+    # Status -> percent_built generator (replaces an if/elif chain); called with
+    # the phase's failed_percent_range
+    percent_for = {
+        "complete": lambda failed_range: 100,
+        "failed": lambda failed_range: _randint(*failed_range),
+        "installing": lambda failed_range: _randint(5, 95),
+    }
+
+    # idx numbers hosts 1..count continuously across both phases
+    start = 1
+    for (phase_count, date_fn, start_args, assigned_args, statuses, weights,
+         failed_range, assign_threshold, build_hours) in phases:
+        # Each phase starts again from the first region
+        region_rows = islice(cycle(REGION_ROWS), phase_count)
+        for idx, (region, racks, build_server, ip_prefix, _) in enumerate(region_rows, start=start):
+            # Generate unique serial
+            serial = generate_serial(rng)
+            while serial in used_serials:
+                serial = generate_serial(rng)
+            used_serials.add(serial)
+
+            # Determine build status and percent
+            status = _choices(statuses, weights=weights)[0]
+            percent = percent_for[status](failed_range)
+
+            # Determine assignment (only complete builds can be assigned)
+            assigned_status = "not assigned"
+            assigned_by = None
+            assigned_at = None
+            if status == "complete" and _random() > assign_threshold:
+                assigned_status = "assigned"
+                assigned_by = _choice(SAMPLE_USERS)
+                assigned_at = date_fn(rng, now, *assigned_args)
+
+            build_start = date_fn(rng, now, *start_args)
+            build_end = None
+            if status in FINISHED_BUILD_STATUSES:
+                build_end = build_start + _td(hours=_uniform(*build_hours))
+
+            yield {
+                "uuid": next(uuids),
+                "hostname": generate_hostname(region, idx),
+                "rack_id": _choice(racks),
+                "dbid": generate_dbid(region, idx),
+                "serial_number": serial,
+                "machine_type": _choice(MACHINE_TYPES),
+                "bundle": _choice(BUNDLES),
+                "ip_address": f"{ip_prefix}.{100 + idx}",
+                "mac_address": next(macs),
+                "build_server": build_server,
+                "percent_built": percent,
+                "build_status": status,
+                "assigned_status": assigned_status,
+                "build_start": build_start,
+                "build_end": build_end,
+                "assigned_by": assigned_by,
+                "assigned_at": assigned_at,
+            }
+        start += phase_count
+
+
+def generate_based_records(
+    count: int, include_yesterday: bool = True, seed: Optional[int | str] = None
+) -> Iterator[dict]:
+    """Yield based table rows keyed by column name."""
+    rng = random.Random(seed)
+    _choice = rng.choice
+    now = datetime.utcnow()
 
     today_count = count if not include_yesterday else int(count * 0.65)
     yesterday_count = count - today_count if include_yesterday else 0
 
+    # (count, date_fn, date_args) per date phase
+    phases = [
+        (today_count, random_datetime_today, (6,)),
+        (yesterday_count, random_datetime_yesterday, ()),
+    ]
+
+    uuids = generate_uuids(rng, today_count + yesterday_count)
+    macs = generate_macs(rng, today_count + yesterday_count)
     used_serials = set()
 
-    # Today's records
-    for i in range(today_count):
-        region = regions[i % len(regions)]
-        config = REGIONS[region]
-
-        serial = generate_serial()
-        while serial in used_serials:
-            serial = generate_serial()
-        used_serials.add(serial)
-
-        records.append(BasedDB(
-            uuid=str(uuid.uuid4()),
-            date_added=random_datetime_today(6),
-            serial_number=serial,
-            machine_type=random.choice(MACHINE_TYPES),
-            rack_id=random.choice(config["racks"]),
-            condition=random.choice(CONDITIONS),
-            mac_address=generate_mac(),
-            ip_address=generate_ip(region, 200 + i),
-            build_server=config["build_server"],
-        ))
-
-    # Yesterday's records
-    for i in range(yesterday_count):
-        region = regions[i % len(regions)]
-        config = REGIONS[region]
-
-        serial = generate_serial()
-        while serial in used_serials:
-            serial = generate_serial()
-        used_serials.add(serial)
-
-        records.append(BasedDB(
-            uuid=str(uuid.uuid4()),
-            date_added=random_datetime_yesterday(),
-            serial_number=serial,
-            machine_type=random.choice(MACHINE_TYPES),
-            rack_id=random.choice(config["racks"]),
-            condition=random.choice(CONDITIONS),
-            mac_address=generate_mac(),
-            ip_address=generate_ip(region, 200 + today_count + i),
-            build_server=config["build_server"],
-        ))
-
-    return records
-
-
-def generate_preconfig_records(count: int) -> list[PreconfigDB]:
-    """Generate preconfig records distributed across depots."""
-    records = []
-    regions = list(REGIONS.keys())
-
-    for i in range(count):
-        region = regions[i % len(regions)]
-        config = REGIONS[region]
+    # host_offset numbers rows 0..count-1 continuously across both phases
+    start = 0
+    for phase_count, date_fn, date_args in phases:
+        # Each phase starts again from the first region
+        region_rows = islice(cycle(REGION_ROWS), phase_count)
+        for host_offset, (_, racks, build_server, ip_prefix, _) in enumerate(region_rows, start=start):
+            serial = generate_serial(rng)
+            while serial in used_serials:
+                serial = generate_serial(rng)
+            used_serials.add(serial)
+
+            yield {
+                "uuid": next(uuids),
+                "date_added": date_fn(rng, now, *date_args),
+                "serial_number": serial,
+                "machine_type": _choice(MACHINE_TYPES),
+                "rack_id": _choice(racks),
+                "condition": _choice(CONDITIONS),
+                "mac_address": next(macs),
+                "ip_address": f"{ip_prefix}.{200 + host_offset}",
+                "build_server": build_server,
+            }
+        start += phase_count
+
+
+def generate_preconfig_records(count: int, seed: Optional[int | str] = None) -> Iterator[dict]:
+    """Yield preconfig rows (keyed by column name) distributed across depots."""
+    rng = random.Random(seed)
+    _choice = rng.choice
+    _random = rng.random
+    now = datetime.utcnow()
+
+    region_rows = islice(cycle(REGION_ROWS), count)
+    for i, (region, _, _, _, depot_id) in enumerate(region_rows):
 
         # Some preconfigs have been pushed, some haven't
         pushed_at = None
-        if random.random() > 0.4:
-            pushed_at = random_datetime_today(24)
+        if _random() > 0.4:
+            pushed_at = random_datetime_today(rng, now, 24)
 
-        records.append(PreconfigDB(
-            dbid=f"pre-{region}-{i+1:03d}",
-            depot=config["depot_id"],
-            appliance_size=random.choice(APPLIANCE_SIZES),
-            config=generate_config(),
-            created_by=random.choice(SAMPLE_USERS),
-            pushed_at=pushed_at,
-        ))
-
-    return records
+        yield {
+            "dbid": f"pre-{region}-{i+1:03d}",
+            "depot": depot_id,
+            "appliance_size": _choice(APPLIANCE_SIZES),
+            "config": generate_config(rng),
+            "created_by": _choice(SAMPLE_USERS),
+            "last_pushed_at": pushed_at,
+        }
 
 
 # =============================================================================
 # Database Operations
 # =============================================================================
 
-async def clear_tables():
-    """Clear all seed tables (build_history, based, preconfigs)."""
-    async with get_db_context() as db:
-        logger.info("Clearing existing data from tables...")
+async def clear_tables(db: AsyncSession):
+    """Clear all seed tables (build_history, based, preconfigs). Caller commits."""
+    logger.info("Clearing existing data from tables...")
 
-        # Delete in order to avoid foreign key issues
-        await db.execute(delete(BuildHistoryDB))
-        await db.execute(delete(BasedDB))
-        await db.execute(delete(PreconfigDB))
-        await db.commit()
+    # TRUNCATE drops and recreates the table data instead of deleting row by
+    # row. These tables have no foreign keys between them, so no FK guard is
+    # needed. Note that MySQL commits implicitly on TRUNCATE.
+    for model in (BuildHistoryDB, BasedDB, PreconfigDB):
+        try:
+            await db.execute(text(f"TRUNCATE TABLE {model.__tablename__}"))
+        except OperationalError as e:
+            # e.g. missing DROP privilege - fall back to a plain DELETE
+            logger.warning(f"TRUNCATE failed for {model.__tablename__}, falling back to DELETE: {e}")
+            await db.execute(delete(model))
 
-        logger.info("Tables cleared successfully")
+    logger.info("Tables cleared successfully")
 
 
-async def seed_build_history(records: list[BuildHistoryDB]):
-    """Insert build_history records."""
-    async with get_db_context() as db:
-        db.add_all(records)
-        await db.commit()
-        logger.info(f"Seeded {len(records)} build_history records")
+async def insert_in_chunks(db: AsyncSession, table, records: Iterable[dict]) -> int:
+    """
+    Insert rows with a Core executemany per chunk of INSERT_CHUNK_SIZE rows.
+    Only one chunk is held in memory at a time. Returns the number of rows inserted.
+    """
+    records = iter(records)
+    inserted = 0
+    while chunk := list(islice(records, INSERT_CHUNK_SIZE)):
+        await db.execute(table.insert(), chunk)
+        inserted += len(chunk)
+    return inserted
 
 
-async def seed_based(records: list[BasedDB]):
-    """Insert based records."""
-    async with get_db_context() as db:
-        db.add_all(records)
-        await db.commit()
-        logger.info(f"Seeded {len(records)} based records")
+async def seed_build_history(db: AsyncSession, records: Iterable[dict]) -> int:
+    """Insert build_history records (no ORM objects). Caller commits."""
+    count = await insert_in_chunks(db, BuildHistoryDB.__table__, records)
+    logger.info(f"Seeded {count} build_history records")
+    return count
+
 
+async def seed_based(db: AsyncSession, records: Iterable[dict]) -> int:
+    """Insert based records (no ORM objects). Caller commits."""
+    count = await insert_in_chunks(db, BasedDB.__table__, records)
+    logger.info(f"Seeded {count} based records")
+    return count
 
-async def seed_preconfigs(records: list[PreconfigDB]):
-    """Insert preconfig records."""
+
+async def seed_preconfigs(db: AsyncSession, records: Iterable[dict]) -> int:
+    """Insert preconfig records (no ORM objects). Caller commits."""
+    count = await insert_in_chunks(db, PreconfigDB.__table__, records)
+    logger.info(f"Seeded {count} preconfig records")
+    return count
+
+
+async def seed_in_session(seed_fn, records: Iterable[dict]) -> int:
+    """Run a seed_* helper in its own session, committing on exit."""
     async with get_db_context() as db:
-        db.add_all(records)
-        await db.commit()
-        logger.info(f"Seeded {len(records)} preconfig records")
+        return await seed_fn(db, records)
 
 
 # =============================================================================
 # Main Entry Point
 # =============================================================================
 
+def table_seed(seed: Optional[int], table: str) -> Optional[str]:
+    """Per-table seed, so tables seeded with the same --seed don't share a random stream."""
+    return None if seed is None else f"{seed}-{table}"
+
+
 async def main(args):
     """Main seeding function."""
     logger.info("=" * 60)
@@ -427,12 +441,6 @@ async def main(args):
     # Initialize database (creates tables if they don't exist)
     await init_db()
 
-    # Clear tables unless in append mode
-    if not args.append:
-        await clear_tables()
-    else:
-        logger.info("Append mode: keeping existing data")
-
     include_yesterday = not args.today_only
 
     # Calculate record counts for each table
@@ -450,18 +458,37 @@ async def main(args):
     if include_yesterday:
         logger.info("Including data from yesterday")
 
-    # Generate and insert records
-    build_records = generate_build_history_records(build_count, include_yesterday)
-    based_records = generate_based_records(based_count, include_yesterday)
-
-    await seed_build_history(build_records)
-    await seed_based(based_records)
+    # Clear tables unless in append mode
+    if not args.append:
+        async with get_db_context() as db:
+            await clear_tables(db)
+    else:
+        logger.info("Append mode: keeping existing data")
 
-    total_created = len(build_records) + len(based_records)
+    # The three tables are independent, so seed them concurrently. An
+    # AsyncSession can't run statements concurrently, so each seed gets its
+    # own session/connection (DB_POOL_SIZE defaults to 10).
+    # Records are generated lazily and inserted in chunks as they are produced.
+    seeds = [
+        seed_in_session(
+            seed_build_history,
+            generate_build_history_records(
+                build_count, include_yesterday, table_seed(args.seed, "build_history")
+            ),
+        ),
+        seed_in_session(
+            seed_based,
+            generate_based_records(based_count, include_yesterday, table_seed(args.seed, "based")),
+        ),
+    ]
     if preconfig_count > 0:
-        preconfig_records = generate_preconfig_records(preconfig_count)
-        await seed_preconfigs(preconfig_records)
-        total_created += len(preconfig_records)
+        seeds.append(
+            seed_in_session(
+                seed_preconfigs,
+                generate_preconfig_records(preconfig_count, table_seed(args.seed, "preconfigs")),
+            )
+        )
+    total_created = sum(await asyncio.gather(*seeds))
 
     logger.info("=" * 60)
     logger.info("Seeding completed successfully!")
@@ -492,7 +519,17 @@ def parse_args():
         action="store_true",
         help="Only generate records for today (no historical data)"
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Random seed for reproducible data (default: random; not allowed with --append)"
+    )
+    args = parser.parse_args()
+    # A seeded append regenerates the same uuid/serial_number values, which are unique columns
+    if args.append and args.seed is not None:
+        parser.error("--seed cannot be used with --append (it would repeat unique values)")
+    return args
 
 
 if __name__ == "__main__":
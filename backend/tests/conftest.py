@@ -2,14 +2,21 @@
 Shared test fixtures and configuration
 """
 
+from contextlib import contextmanager
+
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
+from pydantic import TypeAdapter
 from typing import Dict, Any
 
 from main import app
 from app.auth import saml_auth, _sessions
 from app.routers.config import get_config
 from app.correlation import correlation_id_var
+from app.middleware import RateLimitMiddleware
+from app.models import Server, PreconfigData, PushPreconfigRequest, AssignRequest
 
 
 def get_valid_regions() -> list:
@@ -40,15 +47,45 @@ def test_app():
     return app
 
 
+@pytest.fixture(scope="session")
+def shared_client(test_app):
+    """
+    Provides one test client for the whole session
+
+    Redirects are returned as-is (as with the async client) rather than followed
+    """
+    return TestClient(test_app, follow_redirects=False)
+
+
 @pytest.fixture
-def client(test_app):
+def client(shared_client):
     """
-    Provides a test client for making requests
+    Provides a test client for making requests, with no cookies from earlier tests
     """
-    return TestClient(test_app)
+    shared_client.cookies.clear()
+    return shared_client
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_client(test_app):
+    """
+    Provides one async client for the session that calls the app in-process over ASGI
+    """
+    transport = ASGITransport(app=test_app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as ac:
+        yield ac
 
 
 @pytest.fixture
+def async_client_clean(async_client):
+    """
+    Provides the shared async client with no cookies from earlier tests
+    """
+    async_client.cookies.clear()
+    return async_client
+
+
+@pytest.fixture(scope="session")
 def mock_user_data() -> Dict[str, Any]:
     """
     Provides mock user data for testing
@@ -62,7 +99,7 @@ def mock_user_data() -> Dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_admin_user_data() -> Dict[str, Any]:
     """
     Provides mock admin user data for testing
@@ -76,7 +113,7 @@ def mock_admin_user_data() -> Dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_first_region_builder_data() -> Dict[str, Any]:
     """
     Provides mock builder user data for testing (first region from config)
@@ -93,7 +130,7 @@ def mock_first_region_builder_data() -> Dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_unauthorized_user_data() -> Dict[str, Any]:
     """
     Provides mock unauthorized user data for testing (not in permissions)
@@ -107,16 +144,23 @@ def mock_unauthorized_user_data() -> Dict[str, Any]:
     }
 
 
+# User data above is session-scoped and read-only. The authenticated_* fixtures
+# stay function-scoped: clear_sessions empties the store around every test and
+# client / async_client_clean drop the shared clients' cookies, so sessions and
+# cookies never leak.
+
+
 @pytest.fixture
-def authenticated_user(client, mock_user_data) -> str:
+def authenticated_user(client, async_client_clean, mock_user_data) -> str:
     """
     Creates an authenticated session and returns the session token
     """
     session_token = "test-session-token-123"
     saml_auth.store_session(session_token, mock_user_data)
 
-    # Set the cookie on the client
+    # Set the cookie on both shared clients; the test uses whichever it requested
     client.cookies.set("session_token", session_token)
+    async_client_clean.cookies.set("session_token", session_token)
 
     yield session_token
 
@@ -126,15 +170,16 @@ def authenticated_user(client, mock_user_data) -> str:
 
 
 @pytest.fixture
-def authenticated_admin(client, mock_admin_user_data) -> str:
+def authenticated_admin(client, async_client_clean, mock_admin_user_data) -> str:
     """
     Creates an authenticated admin session and returns the session token
     """
     session_token = "admin-session-token-123"
     saml_auth.store_session(session_token, mock_admin_user_data)
 
-    # Set the cookie on the client
+    # Set the cookie on both shared clients; the test uses whichever it requested
     client.cookies.set("session_token", session_token)
+    async_client_clean.cookies.set("session_token", session_token)
 
     yield session_token
 
@@ -144,15 +189,18 @@ def authenticated_admin(client, mock_admin_user_data) -> str:
 
 
 @pytest.fixture
-def authenticated_first_region_builder(client, mock_first_region_builder_data) -> str:
+def authenticated_first_region_builder(
+    client, async_client_clean, mock_first_region_builder_data
+) -> str:
     """
     Creates an authenticated builder session for the first region and returns the session token
     """
     session_token = "first-region-builder-session-token-123"
     saml_auth.store_session(session_token, mock_first_region_builder_data)
 
-    # Set the cookie on the client
+    # Set the cookie on both shared clients; the test uses whichever it requested
     client.cookies.set("session_token", session_token)
+    async_client_clean.cookies.set("session_token", session_token)
 
     yield session_token
 
@@ -162,7 +210,9 @@ def authenticated_first_region_builder(client, mock_first_region_builder_data) -
 
 
 @pytest.fixture
-def authenticated_unauthorized_user(client, mock_unauthorized_user_data) -> str:
+def authenticated_unauthorized_user(
+    client, async_client_clean, mock_unauthorized_user_data
+) -> str:
     """
     Creates an authenticated session for a user not in permissions
     This should result in 403 Forbidden errors
@@ -170,8 +220,9 @@ def authenticated_unauthorized_user(client, mock_unauthorized_user_data) -> str:
     session_token = "unauthorized-session-token-123"
     saml_auth.store_session(session_token, mock_unauthorized_user_data)
 
-    # Set the cookie on the client
+    # Set the cookie on both shared clients; the test uses whichever it requested
     client.cookies.set("session_token", session_token)
+    async_client_clean.cookies.set("session_token", session_token)
 
     yield session_token
 
@@ -180,6 +231,27 @@ def authenticated_unauthorized_user(client, mock_unauthorized_user_data) -> str:
         del _sessions[session_token]
 
 
+@pytest.fixture(scope="session")
+def logged_in_as():
+    """
+    Provides a context manager that logs a client in as a user for one block,
+    for module-scoped fixtures that fetch a response once and share it
+    """
+
+    @contextmanager
+    def _logged_in_as(client, user_data: Dict[str, Any]):
+        session_token = f"logged-in-as-{user_data['email']}"
+        saml_auth.store_session(session_token, user_data)
+        client.cookies.set("session_token", session_token)
+        try:
+            yield client
+        finally:
+            client.cookies.clear()
+            saml_auth.delete_session(session_token)
+
+    return _logged_in_as
+
+
 @pytest.fixture(autouse=True)
 def clear_sessions():
     """
@@ -190,6 +262,26 @@ def clear_sessions():
     _sessions.clear()
 
 
+def _rate_limiters(asgi_app):
+    """Yield the RateLimitMiddleware instances in the app's built middleware stack"""
+    node = asgi_app.middleware_stack  # None until the first request builds it
+    while node is not None:
+        if isinstance(node, RateLimitMiddleware):
+            yield node
+        node = getattr(node, "app", None)
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limits(test_app):
+    """
+    Clear the rate limiter's per-client request history before each test, so the
+    suite's total request count never trips the 429 burst limit
+    """
+    for limiter in _rate_limiters(test_app):
+        limiter.requests.clear()
+    yield
+
+
 @pytest.fixture(autouse=True)
 def reset_correlation_id():
     """
@@ -234,6 +326,39 @@ def mock_server_data() -> Dict[str, Any]:
     }
 
 
+# Validators are built once and shared, so tests don't rebuild them per payload
+@pytest.fixture(scope="session")
+def server_adapter() -> TypeAdapter:
+    """
+    Provides a prebuilt validator for Server payloads
+    """
+    return TypeAdapter(Server)
+
+
+@pytest.fixture(scope="session")
+def preconfig_adapter() -> TypeAdapter:
+    """
+    Provides a prebuilt validator for PreconfigData payloads
+    """
+    return TypeAdapter(PreconfigData)
+
+
+@pytest.fixture(scope="session")
+def push_preconfig_adapter() -> TypeAdapter:
+    """
+    Provides a prebuilt validator for PushPreconfigRequest payloads
+    """
+    return TypeAdapter(PushPreconfigRequest)
+
+
+@pytest.fixture(scope="session")
+def assign_request_adapter() -> TypeAdapter:
+    """
+    Provides a prebuilt validator for AssignRequest payloads
+    """
+    return TypeAdapter(AssignRequest)
+
+
 @pytest.fixture
 def mock_build_status_data() -> Dict[str, Any]:
     """
@@ -261,7 +386,7 @@ def mock_build_status_data() -> Dict[str, Any]:
     return data
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_date() -> str:
     """
     Provides a sample date string for testing
@@ -269,7 +394,7 @@ def sample_date() -> str:
     return "2024-01-15"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_date() -> str:
     """
     Provides an invalid date string for testing
@@ -277,6 +402,28 @@ def invalid_date() -> str:
     return "invalid-date"
 
 
+class SleepRecorder:
+    """
+    Minimal async stand-in for asyncio.sleep that records requested delays
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, delay):
+        self.calls.append(delay)
+
+
+@pytest.fixture
+def sleep_recorder(monkeypatch) -> SleepRecorder:
+    """
+    Skips the simulated delay in the assign router, recording each call
+    """
+    recorder = SleepRecorder()
+    monkeypatch.setattr("app.routers.assign.asyncio.sleep", recorder)
+    return recorder
+
+
 # Performance tracking fixtures
 @pytest.fixture
 def track_performance():
@@ -2,8 +2,29 @@
 Integration tests for server assignment endpoints
 """
 
+import asyncio
+import json
+
 import pytest
-from unittest.mock import patch, AsyncMock
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Success message returned by /api/assign (app/routers/assign.py)
+ASSIGN_SUCCESS_MESSAGE = "Server {hostname} assigned successfully"
+
+# Servers for the concurrent assign test, with their request bodies encoded once
+MULTIPLE_SERVERS = [
+    {"serial_number": "SN-001", "hostname": "server-1", "dbid": "1001"},
+    {"serial_number": "SN-002", "hostname": "server-2", "dbid": "1002"},
+    {"serial_number": "SN-003", "hostname": "server-3", "dbid": "1003"},
+]
+MULTIPLE_SERVER_BODIES = [json.dumps(server).encode() for server in MULTIPLE_SERVERS]
+
+
+@pytest.fixture(autouse=True)
+def no_assign_delay(sleep_recorder):
+    """Skips the simulated assign delay for every test in this module"""
+    return sleep_recorder
 
 
 @pytest.fixture
@@ -20,9 +41,9 @@ def mock_assign_request():
 class TestAssignEndpoint:
     """Tests for server assignment endpoint"""
 
-    def test_assign_requires_auth(self, client):
+    async def test_assign_requires_auth(self, async_client_clean):
         """Test assign endpoint requires authentication"""
-        response = client.post(
+        response = await async_client_clean.post(
             "/api/assign",
             json={
                 "serial_number": "SN-001",
@@ -32,10 +53,11 @@ class TestAssignEndpoint:
         )
         assert response.status_code == 401
 
-    @patch("app.routers.assign.asyncio.sleep", new_callable=AsyncMock)
-    def test_assign_success(self, mock_sleep, client, authenticated_user):
+    async def test_assign_success(
+        self, async_client_clean, authenticated_user, sleep_recorder
+    ):
         """Test authenticated user can assign a server (mock mode fallback)"""
-        response = client.post(
+        response = await async_client_clean.post(
             "/api/assign",
             json={
                 "serial_number": "SN-TEST-001",
@@ -48,52 +70,50 @@ class TestAssignEndpoint:
         data = response.json()
 
         assert data["status"] == "success"
-        assert "assigned successfully" in data["message"]
-        assert "test-server-001" in data["message"]
+        assert data["message"] == ASSIGN_SUCCESS_MESSAGE.format(
+            hostname="test-server-001"
+        )
 
         # Verify sleep was called (simulated processing)
-        mock_sleep.assert_called_once_with(2)
-
-    def test_assign_missing_fields(self, client, authenticated_user):
+        assert sleep_recorder.calls == [2]
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"hostname": "test-server", "dbid": "100001"},
+            {"serial_number": "SN-001", "dbid": "100001"},
+            {"serial_number": "SN-001", "hostname": "test-server"},
+        ],
+        ids=["missing-serial_number", "missing-hostname", "missing-dbid"],
+    )
+    async def test_assign_missing_fields(
+        self, async_client_clean, authenticated_user, payload
+    ):
         """Test assign rejects request with missing fields"""
-        # Missing serial_number
-        response = client.post(
-            "/api/assign", json={"hostname": "test-server", "dbid": "100001"}
-        )
+        response = await async_client_clean.post("/api/assign", json=payload)
         assert response.status_code == 422
 
-        # Missing hostname
-        response = client.post(
-            "/api/assign", json={"serial_number": "SN-001", "dbid": "100001"}
-        )
-        assert response.status_code == 422
-
-        # Missing dbid
-        response = client.post(
-            "/api/assign", json={"serial_number": "SN-001", "hostname": "test-server"}
-        )
-        assert response.status_code == 422
-
-    def test_assign_empty_fields(self, client, authenticated_user):
+    async def test_assign_empty_fields(self, async_client_clean, authenticated_user):
         """Test assign rejects empty field values (Pydantic validation)"""
         # Empty serial_number - Pydantic min_length=1 validation returns 422
-        response = client.post(
+        response = await async_client_clean.post(
             "/api/assign",
             json={"serial_number": "", "hostname": "test-server", "dbid": "100001"},
         )
         assert response.status_code == 422
 
-    def test_assign_invalid_json(self, client, authenticated_user):
+    async def test_assign_invalid_json(self, async_client_clean, authenticated_user):
         """Test assign rejects invalid JSON"""
-        response = client.post(
-            "/api/assign", data="not-json", headers={"Content-Type": "application/json"}
+        response = await async_client_clean.post(
+            "/api/assign",
+            content="not-json",
+            headers={"Content-Type": "application/json"},
         )
         assert response.status_code == 422
 
-    @patch("app.routers.assign.asyncio.sleep", new_callable=AsyncMock)
-    def test_assign_admin_access(self, mock_sleep, client, authenticated_admin):
+    async def test_assign_admin_access(self, async_client_clean, authenticated_admin):
         """Test admin can assign servers"""
-        response = client.post(
+        response = await async_client_clean.post(
             "/api/assign",
             json={
                 "serial_number": "SN-ADMIN-001",
@@ -103,27 +123,34 @@ class TestAssignEndpoint:
         )
         assert response.status_code == 200
 
-    @patch("app.routers.assign.asyncio.sleep", new_callable=AsyncMock)
-    def test_assign_multiple_servers(self, mock_sleep, client, authenticated_user):
-        """Test assigning multiple servers sequentially"""
-        servers = [
-            {"serial_number": "SN-001", "hostname": "server-1", "dbid": "1001"},
-            {"serial_number": "SN-002", "hostname": "server-2", "dbid": "1002"},
-            {"serial_number": "SN-003", "hostname": "server-3", "dbid": "1003"},
-        ]
-
-        for server in servers:
-            response = client.post("/api/assign", json=server)
+    async def test_assign_multiple_servers(
+        self, async_client_clean, authenticated_user
+    ):
+        """Test assigning multiple servers concurrently"""
+        responses = await asyncio.gather(
+            *(
+                async_client_clean.post(
+                    "/api/assign", content=body, headers=JSON_HEADERS
+                )
+                for body in MULTIPLE_SERVER_BODIES
+            )
+        )
+        # gather preserves order, so each response lines up with its request
+        for server, response in zip(MULTIPLE_SERVERS, responses):
             assert response.status_code == 200
             data = response.json()
             assert data["status"] == "success"
+            assert data["message"] == ASSIGN_SUCCESS_MESSAGE.format(
+                hostname=server["hostname"]
+            )
 
-    @patch("app.routers.assign.asyncio.sleep", new_callable=AsyncMock)
-    def test_assign_response_structure(
-        self, mock_sleep, client, authenticated_user, mock_assign_request
+    async def test_assign_response_structure(
+        self, async_client_clean, authenticated_user, mock_assign_request
     ):
         """Test assign response has correct structure"""
-        response = client.post("/api/assign", json=mock_assign_request)
+        response = await async_client_clean.post(
+            "/api/assign", json=mock_assign_request
+        )
         data = response.json()
 
         # Required fields
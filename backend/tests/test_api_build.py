@@ -3,87 +3,102 @@ Integration tests for build status and build history endpoints
 """
 
 import pytest
+import pytest_asyncio
 from datetime import date
+from pydantic import BaseModel, ConfigDict, Field
+
 from app.routers.config import get_config
 
+# Valid region codes from config.json, read once at import
+VALID_REGIONS = list(get_config().get("regions", {}).keys())
+FIRST_REGION = VALID_REGIONS[0]
+SECOND_REGION = VALID_REGIONS[1] if len(VALID_REGIONS) > 1 else FIRST_REGION
+
+FIRST_REGION_HISTORY_URL = f"/api/build-history/{FIRST_REGION}"
+
+
+class BuildStatusServer(BaseModel):
+    """Expected shape of a server entry; every field is required"""
+
+    model_config = ConfigDict(strict=True, extra="forbid")
 
-def get_valid_regions() -> list:
-    """Get valid region codes from config.json"""
-    config = get_config()
-    return list(config.get("regions", {}).keys())
+    rackID: str
+    hostname: str
+    dbid: str
+    serial_number: str
+    percent_built: int = Field(ge=0, le=100)
+    assigned_status: str
+    machine_type: str
+    status: str
+
+
+@pytest_asyncio.fixture(scope="module")
+async def build_status_response(async_client, mock_admin_user_data, logged_in_as):
+    """Fetches /api/build-status once as admin and shares the response"""
+    with logged_in_as(async_client, mock_admin_user_data):
+        return await async_client.get("/api/build-status")
+
+
+@pytest.fixture(scope="module")
+def build_status_data(build_status_response):
+    """Parsed JSON body of the shared build status response"""
+    return build_status_response.json()
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "url",
+    [
+        "/api/build-status",
+        FIRST_REGION_HISTORY_URL,
+        f"{FIRST_REGION_HISTORY_URL}/2024-01-15",
+    ],
+    ids=["build-status", "build-history", "build-history-with-date"],
+)
+async def test_build_endpoints_require_auth(async_client_clean, url):
+    """Test build status and history endpoints require authentication"""
+    response = await async_client_clean.get(url)
+    assert response.status_code == 401
 
 
 @pytest.mark.integration
 class TestBuildStatusEndpoint:
     """Tests for build status endpoint"""
 
-    def test_build_status_requires_auth(self, client):
-        """Test build status endpoint requires authentication"""
-        response = client.get("/api/build-status")
-        assert response.status_code == 401
-
-    def test_build_status_success(self, client, authenticated_admin):
+    def test_build_status_success(self, build_status_response, build_status_data):
         """Test admin can get build status for all regions"""
-        response = client.get("/api/build-status")
-
-        assert response.status_code == 200
-        data = response.json()
+        assert build_status_response.status_code == 200
+        data = build_status_data
 
         # Verify response structure contains all regions from config
-        regions = get_valid_regions()
-        for region in regions:
+        for region in VALID_REGIONS:
             assert region in data
             # Verify each region returns a list
             assert isinstance(data[region], list)
 
-    def test_build_status_server_structure(self, client, authenticated_admin):
+    def test_build_status_server_structure(self, build_status_data):
         """Test build status servers have correct structure"""
-        response = client.get("/api/build-status")
-        data = response.json()
+        data = build_status_data
 
-        # Check at least one region has servers
-        regions = get_valid_regions()
-        all_servers = []
-        for region in regions:
-            all_servers.extend(data.get(region, []))
-        if all_servers:
-            server = all_servers[0]
-
-            # Verify server has required fields
-            assert "rackID" in server
-            assert "hostname" in server
-            assert "dbid" in server
-            assert "serial_number" in server
-            assert "percent_built" in server
-            assert "assigned_status" in server
-            assert "machine_type" in server
-            assert "status" in server
-
-            # Verify percent_built is valid
-            assert 0 <= server["percent_built"] <= 100
-
-    def test_build_status_admin_access(self, client, authenticated_admin):
-        """Test admin can access build status"""
-        response = client.get("/api/build-status")
-        assert response.status_code == 200
+        # Check the first server found in any region
+        server = next(
+            (server for region in VALID_REGIONS for server in data.get(region, [])),
+            None,
+        )
+        if server:
+            # Required fields present and percent_built within 0-100; raises on mismatch
+            BuildStatusServer.model_validate(server)
 
 
 @pytest.mark.integration
 class TestBuildHistoryEndpoint:
     """Tests for build history endpoint with region-based routing"""
 
-    def test_build_history_requires_auth(self, client):
-        """Test build history endpoint requires authentication"""
-        regions = get_valid_regions()
-        region = regions[0]
-        response = client.get(f"/api/build-history/{region}")
-        assert response.status_code == 401
-
-    def test_build_history_today_success(self, client, authenticated_user):
+    async def test_build_history_today_success(
+        self, async_client_clean, authenticated_user
+    ):
         """Test authenticated user can get today's build history for a region"""
-        regions = get_valid_regions()
-        region = regions[0]
-        response = client.get(f"/api/build-history/{region}")
+        response = await async_client_clean.get(FIRST_REGION_HISTORY_URL)
 
         assert response.status_code == 200
         data = response.json()
@@ -94,7 +109,7 @@ class TestBuildHistoryEndpoint:
         assert "servers" in data
 
         # Verify region matches request
-        assert data["region"] == region
+        assert data["region"] == FIRST_REGION
 
         # Verify date is today
         assert data["date"] == date.today().isoformat()
@@ -102,80 +117,74 @@ class TestBuildHistoryEndpoint:
         # Verify servers is a list
         assert isinstance(data["servers"], list)
 
-    def test_build_history_with_date_success(
-        self, client, authenticated_admin, sample_date
+    async def test_build_history_with_date_success(
+        self, async_client_clean, authenticated_admin, sample_date
     ):
         """Test admin can get build history for specific date"""
-        regions = get_valid_regions()
-        region = regions[1] if len(regions) > 1 else regions[0]
-        response = client.get(f"/api/build-history/{region}/{sample_date}")
+        response = await async_client_clean.get(
+            f"/api/build-history/{SECOND_REGION}/{sample_date}"
+        )
 
         assert response.status_code == 200
         data = response.json()
 
         # Verify response structure
-        assert data["region"] == region
+        assert data["region"] == SECOND_REGION
         assert data["date"] == sample_date
         assert isinstance(data["servers"], list)
 
-    def test_build_history_all_regions(self, client, authenticated_admin):
+    @pytest.mark.parametrize("region", VALID_REGIONS)
+    async def test_build_history_all_regions(
+        self, async_client_clean, authenticated_admin, region
+    ):
         """Test admin can access build history for all valid regions"""
-        regions = get_valid_regions()
-        for region in regions:
-            response = client.get(f"/api/build-history/{region}")
-            assert response.status_code == 200, f"Failed for region {region}"
-            data = response.json()
-            assert data["region"] == region
-
-    def test_build_history_invalid_region(self, client, authenticated_user):
-        """Test build history rejects invalid region"""
-        response = client.get("/api/build-history/invalid")
-
-        assert response.status_code == 400
+        response = await async_client_clean.get(f"/api/build-history/{region}")
+        assert response.status_code == 200
         data = response.json()
-        assert "Invalid region" in data["detail"]
+        assert data["region"] == region
 
-    def test_build_history_invalid_date_format(self, client, authenticated_user):
-        """Test build history rejects invalid date format"""
-        regions = get_valid_regions()
-        region = regions[0]
-        response = client.get(f"/api/build-history/{region}/invalid-date")
+    @pytest.mark.parametrize(
+        "url,detail",
+        [
+            ("/api/build-history/invalid", "Invalid region"),
+            ("/api/build-history/xyz/2024-01-15", "Invalid region"),
+            (f"{FIRST_REGION_HISTORY_URL}/invalid-date", "Invalid date format"),
+        ],
+        ids=["invalid-region", "invalid-region-with-date", "invalid-date-format"],
+    )
+    async def test_build_history_rejects_bad_request(
+        self, async_client_clean, authenticated_user, url, detail
+    ):
+        """Test build history rejects invalid regions and date formats"""
+        response = await async_client_clean.get(url)
 
         assert response.status_code == 400
-        data = response.json()
-        assert "Invalid date format" in data["detail"]
+        assert detail in response.json()["detail"]
 
-    def test_build_history_valid_date_formats(self, client, authenticated_user):
+    @pytest.mark.parametrize("date_str", ["2024-01-15", "2024-12-31", "2023-06-01"])
+    async def test_build_history_valid_date_formats(
+        self, async_client_clean, authenticated_user, date_str
+    ):
         """Test build history accepts valid date formats"""
-        regions = get_valid_regions()
-        region = regions[0]
-        valid_dates = ["2024-01-15", "2024-12-31", "2023-06-01"]
-
-        for date_str in valid_dates:
-            response = client.get(f"/api/build-history/{region}/{date_str}")
-            assert response.status_code == 200, f"Failed for date {date_str}"
-
-    def test_build_history_invalid_region_with_date(self, client, authenticated_user):
-        """Test invalid region still rejected with date parameter"""
-        response = client.get("/api/build-history/xyz/2024-01-15")
-
-        assert response.status_code == 400
-        assert "Invalid region" in response.json()["detail"]
+        response = await async_client_clean.get(
+            f"{FIRST_REGION_HISTORY_URL}/{date_str}"
+        )
+        assert response.status_code == 200
 
-    def test_build_history_admin_access(self, client, authenticated_admin):
+    async def test_build_history_admin_access(
+        self, async_client_clean, authenticated_admin
+    ):
         """Test admin can access build history"""
-        regions = get_valid_regions()
-        region = regions[0]
-        response = client.get(f"/api/build-history/{region}")
+        response = await async_client_clean.get(FIRST_REGION_HISTORY_URL)
         assert response.status_code == 200
 
-    def test_build_history_response_structure(
-        self, client, authenticated_user, sample_date
+    async def test_build_history_response_structure(
+        self, async_client_clean, authenticated_user, sample_date
     ):
         """Test build history response has correct structure"""
-        regions = get_valid_regions()
-        region = regions[0]
-        response = client.get(f"/api/build-history/{region}/{sample_date}")
+        response = await async_client_clean.get(
+            f"{FIRST_REGION_HISTORY_URL}/{sample_date}"
+        )
         data = response.json()
 
         # Required top-level fields
@@ -29,6 +29,68 @@ def test_build_log_success(client, authenticated_user, tmp_path, monkeypatch):
     assert response.headers["X-Build-Server"] == "build-server-01"
 
 
+def test_build_log_etag_not_modified(client, authenticated_user, tmp_path, monkeypatch):
+    """Test that a matching If-None-Match returns 304 without the log body"""
+    logs_dir = tmp_path / "build_logs"
+    hostname_dir = logs_dir / "build-server-01" / "test-server-001"
+    hostname_dir.mkdir(parents=True)
+    (hostname_dir / "test-server-001-Installer.log").write_text("Build log content")
+    monkeypatch.setattr("app.routers.buildlogs.settings.BUILD_LOGS_DIR", str(logs_dir))
+
+    response = client.get("/api/build-logs/test-server-001")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    response = client.get("/api/build-logs/test-server-001", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+    assert response.headers["X-Build-Server"] == "build-server-01"
+
+
+def test_build_log_growing_file(client, authenticated_user, tmp_path, monkeypatch):
+    """Test that bytes appended after discovery don't overrun the response"""
+    from app.routers import buildlogs
+
+    logs_dir = tmp_path / "build_logs"
+    hostname_dir = logs_dir / "build-server-01" / "test-server-001"
+    hostname_dir.mkdir(parents=True)
+    log_file = hostname_dir / "test-server-001-Installer.log"
+    log_file.write_text("Line 1\n")
+    monkeypatch.setattr("app.routers.buildlogs.settings.BUILD_LOGS_DIR", str(logs_dir))
+
+    find_log = buildlogs.get_log_file_path
+
+    def find_then_append(hostname):
+        found = find_log(hostname)
+        with open(log_file, "a") as f:
+            f.write("Line 2\n")
+        return found
+
+    monkeypatch.setattr("app.routers.buildlogs.get_log_file_path", find_then_append)
+
+    response = client.get("/api/build-logs/test-server-001")
+    assert response.status_code == 200
+    assert response.text == "Line 1\n"
+    assert response.headers["content-length"] == str(len("Line 1\n"))
+
+
+def test_build_log_streamed_in_chunks(client, authenticated_user, tmp_path, monkeypatch):
+    """Test that a log spanning several read chunks arrives whole"""
+    logs_dir = tmp_path / "build_logs"
+    hostname_dir = logs_dir / "build-server-01" / "test-server-001"
+    hostname_dir.mkdir(parents=True)
+    log_content = "".join(f"Line {i}\n" for i in range(100))
+    (hostname_dir / "test-server-001-Installer.log").write_text(log_content)
+    monkeypatch.setattr("app.routers.buildlogs.settings.BUILD_LOGS_DIR", str(logs_dir))
+    monkeypatch.setattr("app.routers.buildlogs.LOG_CHUNK_SIZE", 16)
+
+    response = client.get("/api/build-logs/test-server-001")
+    assert response.status_code == 200
+    assert response.text == log_content
+    assert response.headers["content-length"] == str(len(log_content))
+
+
 def test_build_log_not_found(client, authenticated_user, tmp_path, monkeypatch):
     """Test 404 when log file doesn't exist"""
     logs_dir = tmp_path / "build_logs"
@@ -112,6 +174,21 @@ def test_custom_hostname_pattern(client, authenticated_user, tmp_path, monkeypat
     assert "Invalid hostname format" in response.json()["detail"]
 
 
+def test_build_log_traversal_rejected_with_permissive_pattern(client, authenticated_user, tmp_path, monkeypatch):
+    """Test that '..' and backslashes are rejected even if HOSTNAME_PATTERN allows them"""
+    from app import config
+
+    logs_dir = tmp_path / "build_logs"
+    logs_dir.mkdir()
+    monkeypatch.setattr("app.routers.buildlogs.settings.BUILD_LOGS_DIR", str(logs_dir))
+    monkeypatch.setattr(config.settings, 'HOSTNAME_PATTERN', r'^.+$')
+
+    for hostname in ["server..01", "server\\01"]:
+        response = client.get(f"/api/build-logs/{hostname}")
+        assert response.status_code == 400
+        assert "invalid hostname" in response.json()["detail"].lower()
+
+
 def test_build_log_empty_hostname(client, authenticated_user):
     """Test that empty hostname is handled"""
     response = client.get("/api/build-logs/")
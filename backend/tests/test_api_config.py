@@ -9,14 +9,14 @@ import pytest
 class TestConfigEndpoint:
     """Tests for config endpoint"""
 
-    def test_config_is_public(self, client):
+    async def test_config_is_public(self, async_client_clean):
         """Test config endpoint is public (no authentication required)"""
-        response = client.get("/api/config")
+        response = await async_client_clean.get("/api/config")
         assert response.status_code == 200
 
-    def test_config_success(self, client):
+    async def test_config_success(self, async_client_clean):
         """Test authenticated user can get config"""
-        response = client.get("/api/config")
+        response = await async_client_clean.get("/api/config")
 
         assert response.status_code == 200
         data = response.json()
@@ -30,9 +30,9 @@ class TestConfigEndpoint:
         assert "dub" in regions
         assert "dal" in regions
 
-    def test_config_region_structure(self, client):
+    async def test_config_region_structure(self, async_client_clean):
         """Test config regions have correct structure"""
-        response = client.get("/api/config")
+        response = await async_client_clean.get("/api/config")
         data = response.json()
 
         for region_code in ["cbg", "dub", "dal"]:
@@ -53,9 +53,9 @@ class TestConfigEndpoint:
             assert isinstance(region["racks"]["normal"], list)
             assert isinstance(region["racks"]["small"], list)
 
-    def test_config_build_server_structure(self, client):
+    async def test_config_build_server_structure(self, async_client_clean):
         """Test config build servers have correct structure"""
-        response = client.get("/api/config")
+        response = await async_client_clean.get("/api/config")
         data = response.json()
 
         for region_code in ["cbg", "dub", "dal"]:
@@ -70,9 +70,45 @@ class TestConfigEndpoint:
                 # Verify build_racks is a list
                 assert isinstance(server_config["build_racks"], list)
 
-    def test_config_admin_access(self, client, authenticated_admin):
+    async def test_config_etag_not_modified(self, async_client_clean):
+        """Test config returns 304 when If-None-Match matches its ETag"""
+        response = await async_client_clean.get("/api/config")
+        etag = response.headers["ETag"]
+
+        response = await async_client_clean.get(
+            "/api/config", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+        assert response.headers["Cache-Control"] == "public, max-age=60"
+
+    @pytest.mark.parametrize(
+        "if_none_match",
+        ["{etag}", "W/{etag}", '"stale", {etag}', "*"],
+        ids=["strong", "weak", "list", "wildcard"],
+    )
+    async def test_config_etag_forms(self, async_client_clean, if_none_match):
+        """Test weak, listed and wildcard If-None-Match forms also get a 304"""
+        response = await async_client_clean.get("/api/config")
+        etag = response.headers["ETag"]
+
+        response = await async_client_clean.get(
+            "/api/config", headers={"If-None-Match": if_none_match.format(etag=etag)}
+        )
+        assert response.status_code == 304
+
+    async def test_config_etag_mismatch(self, async_client_clean):
+        """Test a non-matching If-None-Match gets the full body"""
+        response = await async_client_clean.get(
+            "/api/config", headers={"If-None-Match": '"stale"'}
+        )
+        assert response.status_code == 200
+        assert "regions" in response.json()
+
+    async def test_config_admin_access(self, async_client_clean, authenticated_admin):
         """Test admin can access config"""
-        response = client.get("/api/config")
+        response = await async_client_clean.get("/api/config")
         assert response.status_code == 200
 
 
@@ -10,9 +10,9 @@ from datetime import datetime
 class TestHealthEndpoint:
     """Tests for health check endpoint"""
 
-    def test_health_check_success(self, client):
+    async def test_health_check_success(self, async_client_clean):
         """Test health check returns success"""
-        response = client.get("/api/health")
+        response = await async_client_clean.get("/api/health")
 
         assert response.status_code == 200
         data = response.json()
@@ -24,9 +24,9 @@ class TestHealthEndpoint:
         # Verify timestamp is valid ISO format
         datetime.fromisoformat(data["timestamp"])
 
-    def test_health_check_no_auth_required(self, client):
+    async def test_health_check_no_auth_required(self, async_client_clean):
         """Test health check doesn't require authentication"""
-        response = client.get("/api/health")
+        response = await async_client_clean.get("/api/health")
         assert response.status_code == 200
 
 
@@ -34,9 +34,9 @@ class TestHealthEndpoint:
 class TestRootEndpoint:
     """Tests for root endpoint"""
 
-    def test_root_endpoint_success(self, client):
+    async def test_root_endpoint_success(self, async_client_clean):
         """Test root endpoint returns API info"""
-        response = client.get("/api")
+        response = await async_client_clean.get("/api")
 
         assert response.status_code == 200
         data = response.json()
@@ -45,7 +45,7 @@ class TestRootEndpoint:
         assert data["version"] == "1.0.0"
         assert data["status"] == "running"
 
-    def test_root_endpoint_no_auth_required(self, client):
+    async def test_root_endpoint_no_auth_required(self, async_client_clean):
         """Test root endpoint doesn't require authentication"""
-        response = client.get("/api")
+        response = await async_client_clean.get("/api")
         assert response.status_code == 200
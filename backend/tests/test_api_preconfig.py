@@ -4,121 +4,146 @@ Integration tests for preconfig management endpoints
 
 import pytest
 
+REGIONS = ["cbg", "dub", "dal"]
+REGION_CASINGS = ["CBG", "Cbg", "cbg"]
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "method,url",
+    [
+        ("GET", "/api/preconfig/cbg"),
+        ("POST", "/api/preconfig/cbg/push"),
+        ("GET", "/api/preconfig/pushed"),
+    ],
+    ids=["preconfigs", "push-preconfig", "pushed-preconfigs"],
+)
+async def test_preconfig_endpoints_require_auth(async_client_clean, method, url):
+    """Test preconfig endpoints require authentication"""
+    response = await async_client_clean.request(method, url)
+    assert response.status_code == 401
+
 
 @pytest.mark.integration
 class TestPreconfigsByRegionEndpoint:
     """Tests for get preconfigs by region endpoint"""
 
-    def test_preconfigs_requires_auth(self, client):
-        """Test preconfigs endpoint requires authentication"""
-        response = client.get("/api/preconfig/cbg")
-        assert response.status_code == 401
-
-    def test_preconfigs_success(self, client, authenticated_admin):
-        """Test admin can get preconfigs for all regions"""
-        for region in ["cbg", "dub", "dal"]:
-            response = client.get(f"/api/preconfig/{region}")
+    @pytest.mark.parametrize("region", REGIONS, ids=REGIONS)
+    async def test_preconfigs_success(
+        self, async_client_clean, authenticated_admin, region
+    ):
+        """Test admin can get preconfigs for each region"""
+        response = await async_client_clean.get(f"/api/preconfig/{region}")
 
-            assert response.status_code == 200
-            data = response.json()
+        assert response.status_code == 200
+        data = response.json()
 
-            # Verify response is a list
-            assert isinstance(data, list)
+        # Verify response is a list
+        assert isinstance(data, list)
 
-            # Verify preconfig structure if any exist
-            if data:
-                preconfig = data[0]
-                assert "dbid" in preconfig
-                assert "depot" in preconfig
-                assert "appliance_size" in preconfig
-                assert "config" in preconfig
-                assert "created_at" in preconfig
+        # Verify preconfig structure if any exist
+        if data:
+            preconfig = data[0]
+            assert "dbid" in preconfig
+            assert "depot" in preconfig
+            assert "appliance_size" in preconfig
+            assert "config" in preconfig
+            assert "created_at" in preconfig
 
-                # Verify depot is valid
-                assert preconfig["depot"] in [1, 2, 4]
+            # Verify depot is valid
+            assert preconfig["depot"] in [1, 2, 4]
 
-                # Verify config is a dict
-                assert isinstance(preconfig["config"], dict)
+            # Verify config is a dict
+            assert isinstance(preconfig["config"], dict)
 
-    def test_preconfigs_admin_access(self, client, authenticated_admin):
+    async def test_preconfigs_admin_access(
+        self, async_client_clean, authenticated_admin
+    ):
         """Test admin can access preconfigs"""
-        response = client.get("/api/preconfig/cbg")
+        response = await async_client_clean.get("/api/preconfig/cbg")
         assert response.status_code == 200
 
-    def test_preconfigs_invalid_region(self, client, authenticated_user):
+    async def test_preconfigs_invalid_region(
+        self, async_client_clean, authenticated_user
+    ):
         """Test invalid region returns 400"""
-        response = client.get("/api/preconfig/invalid")
+        response = await async_client_clean.get("/api/preconfig/invalid")
         assert response.status_code == 400
         assert "Invalid region" in response.json()["detail"]
 
-    def test_preconfigs_case_insensitive(self, client, authenticated_admin):
+    @pytest.mark.parametrize("region", REGION_CASINGS, ids=REGION_CASINGS)
+    async def test_preconfigs_case_insensitive(
+        self, async_client_clean, authenticated_admin, region
+    ):
         """Test region parameter is case insensitive"""
-        for region in ["CBG", "Cbg", "cbg"]:
-            response = client.get(f"/api/preconfig/{region}")
-            assert response.status_code == 200
+        response = await async_client_clean.get(f"/api/preconfig/{region}")
+        assert response.status_code == 200
 
 
 @pytest.mark.integration
 class TestPushPreconfigEndpoint:
     """Tests for push preconfig endpoint"""
 
-    def test_push_preconfig_requires_auth(self, client):
-        """Test push preconfig endpoint requires authentication"""
-        response = client.post("/api/preconfig/cbg/push")
-        assert response.status_code == 401
+    @pytest.mark.parametrize("region", REGIONS, ids=REGIONS)
+    async def test_push_preconfig_success(
+        self, async_client_clean, authenticated_admin, region
+    ):
+        """Test admin can push preconfig to each region"""
+        response = await async_client_clean.post(f"/api/preconfig/{region}/push")
 
-    def test_push_preconfig_success(self, client, authenticated_admin):
-        """Test admin can push preconfig to all regions"""
-        for region in ["cbg", "dub", "dal"]:
-            response = client.post(f"/api/preconfig/{region}/push")
-
-            assert response.status_code == 200
-            data = response.json()
+        assert response.status_code == 200
+        data = response.json()
 
-            assert data["status"] == "success"
-            assert "successfully" in data["message"]
-            assert region.upper() in data["message"]
+        assert data["status"] == "success"
+        assert "successfully" in data["message"]
 
-    def test_push_preconfig_invalid_region(self, client, authenticated_admin):
+    async def test_push_preconfig_invalid_region(
+        self, async_client_clean, authenticated_admin
+    ):
         """Test push preconfig rejects invalid region"""
-        response = client.post("/api/preconfig/invalid/push")
+        response = await async_client_clean.post("/api/preconfig/invalid/push")
         assert response.status_code == 400
         assert "Invalid region" in response.json()["detail"]
 
-    def test_push_preconfig_admin_access(self, client, authenticated_admin):
+    async def test_push_preconfig_admin_access(
+        self, async_client_clean, authenticated_admin
+    ):
         """Test admin can push preconfig"""
-        response = client.post("/api/preconfig/cbg/push")
+        response = await async_client_clean.post("/api/preconfig/cbg/push")
         assert response.status_code == 200
 
-    def test_push_preconfig_case_insensitive(self, client, authenticated_admin):
+    @pytest.mark.parametrize("region", REGION_CASINGS, ids=REGION_CASINGS)
+    async def test_push_preconfig_case_insensitive(
+        self, async_client_clean, authenticated_admin, region
+    ):
         """Test region parameter is case insensitive"""
-        for region in ["CBG", "Cbg", "cbg"]:
-            response = client.post(f"/api/preconfig/{region}/push")
-            assert response.status_code == 200
-
-    def test_push_preconfig_region_in_response(self, client, authenticated_admin):
-        """Test region appears correctly in response message"""
-        region_map = {"cbg": "CBG", "dub": "DUB", "dal": "DAL"}
+        response = await async_client_clean.post(f"/api/preconfig/{region}/push")
+        assert response.status_code == 200
 
-        for region_input, region_expected in region_map.items():
-            response = client.post(f"/api/preconfig/{region_input}/push")
-            assert response.status_code == 200
-            data = response.json()
-            assert region_expected in data["message"]
+    @pytest.mark.parametrize(
+        "region_input,region_expected",
+        [("cbg", "CBG"), ("dub", "DUB"), ("dal", "DAL")],
+        ids=REGIONS,
+    )
+    async def test_push_preconfig_region_in_response(
+        self, async_client_clean, authenticated_admin, region_input, region_expected
+    ):
+        """Test region appears upper-cased in the response message"""
+        response = await async_client_clean.post(f"/api/preconfig/{region_input}/push")
+        assert response.status_code == 200
+        data = response.json()
+        assert region_expected in data["message"]
 
 
 @pytest.mark.integration
 class TestPushedPreconfigsEndpoint:
     """Tests for get pushed preconfigs endpoint"""
 
-    def test_pushed_preconfigs_requires_auth(self, client):
-        """Test pushed preconfigs endpoint requires authentication"""
-        response = client.get("/api/preconfig/pushed")
-        assert response.status_code == 401
-
-    def test_pushed_preconfigs_success(self, client, authenticated_user):
+    async def test_pushed_preconfigs_success(
+        self, async_client_clean, authenticated_user
+    ):
         """Test authenticated user can get pushed preconfigs"""
-        response = client.get("/api/preconfig/pushed")
+        response = await async_client_clean.get("/api/preconfig/pushed")
 
         assert response.status_code == 200
         data = response.json()
@@ -2,6 +2,8 @@
 Integration tests for server details endpoints
 """
 
+import asyncio
+
 import pytest
 
 
@@ -9,14 +11,18 @@ import pytest
 class TestServerDetailsEndpoint:
     """Tests for server details endpoint"""
 
-    def test_server_details_requires_auth(self, client):
+    async def test_server_details_requires_auth(self, async_client_clean):
         """Test server details endpoint requires authentication"""
-        response = client.get("/api/server-details?hostname=test-server")
+        response = await async_client_clean.get(
+            "/api/server-details?hostname=test-server"
+        )
         assert response.status_code == 401
 
-    def test_server_details_success(self, client, authenticated_user):
+    async def test_server_details_success(self, async_client_clean, authenticated_user):
         """Test authenticated user can get server details"""
-        response = client.get("/api/server-details?hostname=test-server-001")
+        response = await async_client_clean.get(
+            "/api/server-details?hostname=test-server-001"
+        )
 
         assert response.status_code == 200
         data = response.json()
@@ -42,23 +48,31 @@ class TestServerDetailsEndpoint:
         assert "estimated_completion" in data
         assert "last_heartbeat" in data
 
-    def test_server_details_missing_hostname(self, client, authenticated_user):
+    async def test_server_details_missing_hostname(
+        self, async_client_clean, authenticated_user
+    ):
         """Test server details requires hostname parameter"""
-        response = client.get("/api/server-details")
+        response = await async_client_clean.get("/api/server-details")
 
         assert response.status_code == 422  # Unprocessable Entity
 
-    def test_server_details_empty_hostname(self, client, authenticated_user):
+    async def test_server_details_empty_hostname(
+        self, async_client_clean, authenticated_user
+    ):
         """Test server details rejects empty hostname"""
-        response = client.get("/api/server-details?hostname=")
+        response = await async_client_clean.get("/api/server-details?hostname=")
 
         assert response.status_code == 400
         data = response.json()
         assert "Hostname is required" in data["detail"]
 
-    def test_server_details_valid_values(self, client, authenticated_user):
+    async def test_server_details_valid_values(
+        self, async_client_clean, authenticated_user
+    ):
         """Test server details returns valid data types and ranges"""
-        response = client.get("/api/server-details?hostname=test-server")
+        response = await async_client_clean.get(
+            "/api/server-details?hostname=test-server"
+        )
         data = response.json()
 
         # Verify data types
@@ -71,17 +85,29 @@ class TestServerDetailsEndpoint:
         assert data["ram_gb"] > 0
         assert data["storage_gb"] > 0
 
-    def test_server_details_admin_access(self, client, authenticated_admin):
+    async def test_server_details_admin_access(
+        self, async_client_clean, authenticated_admin
+    ):
         """Test admin can access server details"""
-        response = client.get("/api/server-details?hostname=test-server")
+        response = await async_client_clean.get(
+            "/api/server-details?hostname=test-server"
+        )
         assert response.status_code == 200
 
-    def test_server_details_different_hostnames(self, client, authenticated_user):
+    async def test_server_details_different_hostnames(
+        self, async_client_clean, authenticated_user
+    ):
         """Test server details with different hostnames"""
         hostnames = ["server-1", "cbg-srv-001", "test-machine"]
 
-        for hostname in hostnames:
-            response = client.get(f"/api/server-details?hostname={hostname}")
+        # Independent lookups, so issue them concurrently over the one async client
+        responses = await asyncio.gather(
+            *(
+                async_client_clean.get("/api/server-details", params={"hostname": h})
+                for h in hostnames
+            )
+        )
+        for hostname, response in zip(hostnames, responses):
             assert response.status_code == 200
             data = response.json()
             assert data["hostname"] == hostname
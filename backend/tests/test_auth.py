@@ -137,6 +137,22 @@ class TestSessionManagement:
         assert result is None
         assert token not in _sessions  # Should be cleaned up
 
+    def test_store_session_purges_expired(self, mock_user_data, monkeypatch):
+        """Test storing a session sweeps expired sessions once the interval has passed"""
+        _sessions["stale-token"] = {
+            "user_data": mock_user_data,
+            "created_at": datetime.utcnow() - timedelta(hours=2),
+            "expires_at": datetime.utcnow() - timedelta(hours=1),
+        }
+        monkeypatch.setattr(
+            "app.auth._last_session_cleanup", datetime.utcnow() - timedelta(minutes=5)
+        )
+
+        saml_auth.store_session("fresh-token", mock_user_data)
+
+        assert "stale-token" not in _sessions
+        assert "fresh-token" in _sessions
+
     def test_delete_session(self, mock_user_data):
         """Test deleting a session"""
         token = "delete-token"
@@ -156,23 +172,27 @@ class TestSessionManagement:
 class TestGetCurrentUser:
     """Tests for get_current_user dependency"""
 
-    def test_get_current_user_no_token(self, client):
+    async def test_get_current_user_no_token(self, async_client_clean):
         """Test that missing token raises 401"""
-        response = client.get("/api/build-status")
+        response = await async_client_clean.get("/api/build-status")
         assert response.status_code == 401
 
-    def test_get_current_user_invalid_token(self, client):
+    async def test_get_current_user_invalid_token(self, async_client_clean):
         """Test that invalid token raises 401"""
-        client.cookies.set("session_token", "invalid-token")
-        response = client.get("/api/build-status")
+        async_client_clean.cookies.set("session_token", "invalid-token")
+        response = await async_client_clean.get("/api/build-status")
         assert response.status_code == 401
 
-    def test_get_current_user_valid_token(self, client, authenticated_user):
+    async def test_get_current_user_valid_token(
+        self, async_client_clean, authenticated_user
+    ):
         """Test that valid token allows access"""
-        response = client.get("/api/build-status")
+        response = await async_client_clean.get("/api/build-status")
         assert response.status_code == 200
 
-    def test_get_current_user_expired_token(self, client, mock_user_data):
+    async def test_get_current_user_expired_token(
+        self, async_client_clean, mock_user_data
+    ):
         """Test that expired token raises 401"""
         token = "expired-session"
 
@@ -183,8 +203,8 @@ class TestGetCurrentUser:
             "expires_at": datetime.utcnow() - timedelta(hours=1),
         }
 
-        client.cookies.set("session_token", token)
-        response = client.get("/api/build-status")
+        async_client_clean.cookies.set("session_token", token)
+        response = await async_client_clean.get("/api/build-status")
         assert response.status_code == 401
 
 
@@ -193,11 +213,11 @@ class TestGetCurrentUser:
 class TestAuthEndpoints:
     """Tests for authentication endpoints"""
 
-    def test_me_endpoint_authenticated(
-        self, client, authenticated_user, mock_user_data
+    async def test_me_endpoint_authenticated(
+        self, async_client_clean, authenticated_user, mock_user_data
     ):
         """Test /api/me endpoint returns user data when authenticated"""
-        response = client.get("/api/me")
+        response = await async_client_clean.get("/api/me")
 
         assert response.status_code == 200
         data = response.json()
@@ -206,14 +226,16 @@ class TestAuthEndpoints:
         assert data["name"] == mock_user_data["name"]
         assert data["role"] == mock_user_data["role"]
 
-    def test_me_endpoint_unauthenticated(self, client):
+    async def test_me_endpoint_unauthenticated(self, async_client_clean):
         """Test /api/me endpoint requires authentication"""
-        response = client.get("/api/me")
+        response = await async_client_clean.get("/api/me")
         assert response.status_code == 401
 
-    def test_logout_endpoint_authenticated(self, client, authenticated_user):
+    async def test_logout_endpoint_authenticated(
+        self, async_client_clean, authenticated_user
+    ):
         """Test logout endpoint clears session"""
-        response = client.post("/api/logout")
+        response = await async_client_clean.post("/api/logout")
 
         assert response.status_code == 200
         data = response.json()
@@ -221,10 +243,10 @@ class TestAuthEndpoints:
         assert "Logged out" in data["message"]
 
         # Verify cookie is deleted by trying to access protected endpoint
-        response = client.get("/api/build-status")
+        response = await async_client_clean.get("/api/build-status")
         assert response.status_code == 401
 
-    def test_logout_endpoint_unauthenticated(self, client):
+    async def test_logout_endpoint_unauthenticated(self, async_client_clean):
         """Test logout endpoint requires authentication"""
-        response = client.post("/api/logout")
+        response = await async_client_clean.post("/api/logout")
         assert response.status_code == 401
@@ -7,7 +7,7 @@ When run without a database, they test the service logic using mocks.
 
 import pytest
 from datetime import datetime, timezone, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
 
 from app.models import User, RegionLockInfo
 from app.services.lock_service import (
@@ -19,9 +19,21 @@ from app.services.lock_service import (
     DEFAULT_LOCK_TIMEOUT_SECONDS,
 )
 
+# One reference time for the whole module. The lock service compares lock expiry
+# against the real clock, so this is taken at import rather than fixed to a date;
+# "active" locks expire minutes after it, far longer than the module takes to run.
+NOW = datetime.now(timezone.utc)
 
-# Test fixtures
-@pytest.fixture
+# Lock timestamps relative to NOW: an active lock taken a minute ago, and one
+# that expired a minute ago after its five minutes were up
+LOCKED_AT = NOW - timedelta(seconds=60)
+EXPIRES_AT = NOW + timedelta(seconds=300)
+EXPIRED_AT = NOW - timedelta(seconds=60)
+EXPIRED_LOCKED_AT = EXPIRED_AT - timedelta(seconds=240)
+
+
+# Test fixtures; the users are never mutated, so one instance serves the module
+@pytest.fixture(scope="module")
 def mock_user():
     """Create a mock user for testing."""
     return User(
@@ -35,7 +47,7 @@ def mock_user():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_user2():
     """Create a second mock user for testing."""
     return User(
@@ -49,14 +61,60 @@ def mock_user2():
     )
 
 
+class FakeResult:
+    """Minimal stand-in for a SQLAlchemy result: one scalar, a list of rows, or a rowcount"""
+
+    def __init__(self, scalar=None, rows=(), rowcount=0):
+        self._scalar = scalar
+        self._rows = list(rows)
+        self.rowcount = rowcount
+
+    def scalar_one_or_none(self):
+        return self._scalar
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self._rows
+
+
+class FakeSession:
+    """Minimal async session stand-in that returns queued results in order"""
+
+    def __init__(self):
+        self._results = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    def queue(self, *results):
+        self._results.extend(results)
+
+    async def execute(self, statement):
+        return self._results.pop(0)
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+
 @pytest.fixture
 def mock_db():
-    """Create a mock database session."""
-    db = AsyncMock()
-    db.execute = AsyncMock()
-    db.commit = AsyncMock()
-    db.rollback = AsyncMock()
-    return db
+    """Create a fake database session."""
+    return FakeSession()
+
+
+def _make_lock(email, name, locked_at, expires_at, region="cbg"):
+    """Build a stand-in RegionPushLockDB row."""
+    return SimpleNamespace(
+        region=region,
+        locked_by_email=email,
+        locked_by_name=name,
+        locked_at=locked_at,
+        expires_at=expires_at,
+    )
 
 
 class TestRegionLockInfo:
@@ -74,231 +132,131 @@ class TestRegionLockInfo:
 
     def test_locked_region(self):
         """Test creating a locked region lock info."""
-        now = datetime.now(timezone.utc)
-        expires = now + timedelta(seconds=300)
-
         lock_info = RegionLockInfo(
             region="cbg",
             is_locked=True,
             locked_by_email="user@example.com",
             locked_by_name="Test User",
-            locked_at=now,
-            expires_at=expires,
+            locked_at=NOW,
+            expires_at=EXPIRES_AT,
         )
 
         assert lock_info.region == "cbg"
         assert lock_info.is_locked is True
         assert lock_info.locked_by_email == "user@example.com"
         assert lock_info.locked_by_name == "Test User"
-        assert lock_info.locked_at == now
-        assert lock_info.expires_at == expires
+        assert lock_info.locked_at == NOW
+        assert lock_info.expires_at == EXPIRES_AT
 
 
 class TestAcquireLock:
     """Tests for the acquire_lock function."""
 
-    @pytest.mark.asyncio
-    async def test_acquire_lock_no_existing_lock(self, mock_db, mock_user):
-        """Test acquiring a lock when no lock exists."""
-        # Setup: No existing lock
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-
-        # After insert, return a lock owned by the user
-        mock_lock_after_insert = MagicMock()
-        mock_lock_after_insert.region = "cbg"
-        mock_lock_after_insert.locked_by_email = mock_user.email
-        mock_lock_after_insert.locked_by_name = mock_user.name
-        mock_lock_after_insert.locked_at = datetime.now(timezone.utc)
-        mock_lock_after_insert.expires_at = datetime.now(timezone.utc) + timedelta(seconds=300)
-
-        mock_result_after_insert = MagicMock()
-        mock_result_after_insert.scalar_one_or_none.return_value = mock_lock_after_insert
-
-        mock_db.execute.side_effect = [
-            MagicMock(rowcount=0),  # cleanup_expired_locks
-            mock_result,  # check existing lock
-            MagicMock(),  # insert
-            mock_result_after_insert,  # verify lock
-        ]
-
-        success, lock_info = await acquire_lock(mock_db, "cbg", mock_user)
-
-        assert success is True
-        assert lock_info is None
-
-    @pytest.mark.asyncio
-    async def test_acquire_lock_own_lock_exists(self, mock_db, mock_user):
-        """Test acquiring a lock when user already owns the lock."""
-        now = datetime.now(timezone.utc)
-        expires = now + timedelta(seconds=300)
-
-        # Setup: Lock exists owned by the same user
-        mock_existing_lock = MagicMock()
-        mock_existing_lock.region = "cbg"
-        mock_existing_lock.locked_by_email = mock_user.email
-        mock_existing_lock.locked_by_name = mock_user.name
-        mock_existing_lock.locked_at = now - timedelta(seconds=60)
-        mock_existing_lock.expires_at = expires
-
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = mock_existing_lock
-
-        mock_db.execute.side_effect = [
-            MagicMock(rowcount=0),  # cleanup_expired_locks
-            mock_result,  # check existing lock
-        ]
-
-        success, lock_info = await acquire_lock(mock_db, "cbg", mock_user)
-
-        assert success is True
-        assert lock_info is None
-        mock_db.commit.assert_called()
-
-    @pytest.mark.asyncio
-    async def test_acquire_lock_blocked_by_another_user(self, mock_db, mock_user, mock_user2):
-        """Test acquiring a lock when another user holds it."""
-        now = datetime.now(timezone.utc)
-        expires = now + timedelta(seconds=300)
-
-        # Setup: Lock exists owned by another user
-        mock_existing_lock = MagicMock()
-        mock_existing_lock.region = "cbg"
-        mock_existing_lock.locked_by_email = mock_user2.email
-        mock_existing_lock.locked_by_name = mock_user2.name
-        mock_existing_lock.locked_at = now - timedelta(seconds=60)
-        mock_existing_lock.expires_at = expires
-
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = mock_existing_lock
-
-        mock_db.execute.side_effect = [
-            MagicMock(rowcount=0),  # cleanup_expired_locks
-            mock_result,  # check existing lock
-        ]
+    @pytest.mark.parametrize(
+        "holder,expired,expected_success",
+        [
+            pytest.param(None, False, True, id="no-existing-lock"),
+            pytest.param("mock_user", False, True, id="own-lock-exists"),
+            pytest.param("mock_user2", False, False, id="blocked-by-another-user"),
+            pytest.param("mock_user2", True, True, id="expired-lock"),
+        ],
+    )
+    async def test_acquire_lock(
+        self, mock_db, mock_user, mock_user2, holder, expired, expected_success
+    ):
+        """Test acquiring a lock for each state the existing lock can be in."""
+        holder_user = {"mock_user": mock_user, "mock_user2": mock_user2}.get(holder)
+
+        if holder_user is None:
+            # No existing lock: insert, then read back a lock owned by the user
+            existing_lock = None
+            mock_db.queue(
+                FakeResult(rowcount=0),  # cleanup_expired_locks
+                FakeResult(scalar=None),  # check existing lock
+                FakeResult(),  # insert
+                FakeResult(  # verify lock
+                    scalar=_make_lock(mock_user.email, mock_user.name, NOW, EXPIRES_AT)
+                ),
+            )
+        else:
+            existing_lock = _make_lock(
+                holder_user.email,
+                holder_user.name,
+                EXPIRED_LOCKED_AT if expired else LOCKED_AT,
+                EXPIRED_AT if expired else EXPIRES_AT,
+            )
+            mock_db.queue(
+                FakeResult(rowcount=0),  # cleanup_expired_locks
+                FakeResult(scalar=existing_lock),  # check existing lock
+            )
 
         success, lock_info = await acquire_lock(mock_db, "cbg", mock_user)
 
-        assert success is False
-        assert lock_info is not None
-        assert lock_info.is_locked is True
-        assert lock_info.locked_by_email == mock_user2.email
-
-    @pytest.mark.asyncio
-    async def test_acquire_lock_expired_lock(self, mock_db, mock_user, mock_user2):
-        """Test acquiring a lock when an expired lock exists."""
-        now = datetime.now(timezone.utc)
-        expired = now - timedelta(seconds=60)
-
-        # Setup: Lock exists but is expired
-        mock_existing_lock = MagicMock()
-        mock_existing_lock.region = "cbg"
-        mock_existing_lock.locked_by_email = mock_user2.email
-        mock_existing_lock.locked_by_name = mock_user2.name
-        mock_existing_lock.locked_at = expired - timedelta(seconds=240)
-        mock_existing_lock.expires_at = expired
-
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = mock_existing_lock
-
-        mock_db.execute.side_effect = [
-            MagicMock(rowcount=0),  # cleanup_expired_locks
-            mock_result,  # check existing lock
-        ]
+        assert success is expected_success
+        if expected_success:
+            assert lock_info is None
+            if existing_lock is not None:
+                # An own or expired lock is (re)claimed by the requesting user
+                assert existing_lock.locked_by_email == mock_user.email
+        else:
+            assert lock_info is not None
+            assert lock_info.is_locked is True
+            assert lock_info.locked_by_email == mock_user2.email
+
+    async def test_acquire_lock_commits_on_success(self, mock_db, mock_user):
+        """Test acquiring a new lock commits both the expiry cleanup and the insert."""
+        mock_db.queue(
+            FakeResult(rowcount=0),  # cleanup_expired_locks
+            FakeResult(scalar=None),  # check existing lock
+            FakeResult(),  # insert
+            FakeResult(scalar=_make_lock(mock_user.email, mock_user.name, NOW, EXPIRES_AT)),
+        )
 
-        success, lock_info = await acquire_lock(mock_db, "cbg", mock_user)
+        await acquire_lock(mock_db, "cbg", mock_user)
 
-        assert success is True
-        assert lock_info is None
-        # Verify the lock was updated with the new user
-        assert mock_existing_lock.locked_by_email == mock_user.email
+        assert mock_db.commits == 2
+        assert mock_db.rollbacks == 0
 
 
 class TestReleaseLock:
     """Tests for the release_lock function."""
 
-    @pytest.mark.asyncio
-    async def test_release_own_lock(self, mock_db, mock_user):
-        """Test releasing a lock the user owns."""
-        now = datetime.now(timezone.utc)
-
-        # Setup: Lock exists owned by the user
-        mock_existing_lock = MagicMock()
-        mock_existing_lock.region = "cbg"
-        mock_existing_lock.locked_by_email = mock_user.email
-        mock_existing_lock.locked_by_name = mock_user.name
-        mock_existing_lock.locked_at = now - timedelta(seconds=60)
-        mock_existing_lock.expires_at = now + timedelta(seconds=240)
-
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = mock_existing_lock
-
-        mock_db.execute.side_effect = [
-            mock_result,  # select
-            MagicMock(),  # delete
-        ]
-
-        success = await release_lock(mock_db, "cbg", mock_user)
-
-        assert success is True
-        mock_db.commit.assert_called()
-
-    @pytest.mark.asyncio
-    async def test_release_lock_not_owned(self, mock_db, mock_user, mock_user2):
-        """Test releasing a lock the user doesn't own."""
-        now = datetime.now(timezone.utc)
-
-        # Setup: Lock exists owned by another user
-        mock_existing_lock = MagicMock()
-        mock_existing_lock.region = "cbg"
-        mock_existing_lock.locked_by_email = mock_user2.email
-        mock_existing_lock.locked_by_name = mock_user2.name
-        mock_existing_lock.locked_at = now - timedelta(seconds=60)
-        mock_existing_lock.expires_at = now + timedelta(seconds=240)
-
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = mock_existing_lock
-
-        mock_db.execute.return_value = mock_result
-
-        success = await release_lock(mock_db, "cbg", mock_user)
-
-        assert success is False
-
-    @pytest.mark.asyncio
-    async def test_release_nonexistent_lock(self, mock_db, mock_user):
-        """Test releasing a lock that doesn't exist."""
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
+    @pytest.mark.parametrize(
+        "holder,expected_success",
+        [
+            pytest.param("mock_user", True, id="own-lock"),
+            pytest.param("mock_user2", False, id="lock-not-owned"),
+            pytest.param(None, True, id="nonexistent-lock"),
+        ],
+    )
+    async def test_release_lock(self, mock_db, mock_user, mock_user2, holder, expected_success):
+        """Test releasing a lock that is the user's, someone else's, or absent."""
+        holder_user = {"mock_user": mock_user, "mock_user2": mock_user2}.get(holder)
+        existing_lock = (
+            _make_lock(holder_user.email, holder_user.name, LOCKED_AT, EXPIRES_AT)
+            if holder_user is not None
+            else None
+        )
 
-        mock_db.execute.return_value = mock_result
+        mock_db.queue(
+            FakeResult(scalar=existing_lock),  # select
+            FakeResult(),  # delete
+        )
 
         success = await release_lock(mock_db, "cbg", mock_user)
 
-        # Should return True since there's nothing to release
-        assert success is True
+        assert success is expected_success
+        # Only deleting the user's own lock writes anything
+        assert mock_db.commits == (1 if holder == "mock_user" else 0)
 
 
 class TestGetLockStatus:
     """Tests for the get_lock_status function."""
 
-    @pytest.mark.asyncio
     async def test_get_lock_status_locked(self, mock_db):
         """Test getting status of a locked region."""
-        now = datetime.now(timezone.utc)
-        expires = now + timedelta(seconds=300)
-
-        mock_lock = MagicMock()
-        mock_lock.region = "cbg"
-        mock_lock.locked_by_email = "user@example.com"
-        mock_lock.locked_by_name = "Test User"
-        mock_lock.locked_at = now - timedelta(seconds=60)
-        mock_lock.expires_at = expires
-
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = mock_lock
-
-        mock_db.execute.return_value = mock_result
+        mock_lock = _make_lock("user@example.com", "Test User", LOCKED_AT, EXPIRES_AT)
+        mock_db.queue(FakeResult(scalar=mock_lock))
 
         lock_info = await get_lock_status(mock_db, "cbg")
 
@@ -307,13 +265,9 @@ class TestGetLockStatus:
         assert lock_info.locked_by_email == "user@example.com"
         assert lock_info.locked_by_name == "Test User"
 
-    @pytest.mark.asyncio
     async def test_get_lock_status_unlocked(self, mock_db):
         """Test getting status of an unlocked region."""
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-
-        mock_db.execute.return_value = mock_result
+        mock_db.queue(FakeResult(scalar=None))
 
         lock_info = await get_lock_status(mock_db, "cbg")
 
@@ -321,23 +275,10 @@ class TestGetLockStatus:
         assert lock_info.is_locked is False
         assert lock_info.locked_by_email is None
 
-    @pytest.mark.asyncio
     async def test_get_lock_status_expired(self, mock_db):
         """Test getting status of an expired lock (should show as unlocked)."""
-        now = datetime.now(timezone.utc)
-        expired = now - timedelta(seconds=60)
-
-        mock_lock = MagicMock()
-        mock_lock.region = "cbg"
-        mock_lock.locked_by_email = "user@example.com"
-        mock_lock.locked_by_name = "Test User"
-        mock_lock.locked_at = expired - timedelta(seconds=240)
-        mock_lock.expires_at = expired
-
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = mock_lock
-
-        mock_db.execute.return_value = mock_result
+        mock_lock = _make_lock("user@example.com", "Test User", EXPIRED_LOCKED_AT, EXPIRED_AT)
+        mock_db.queue(FakeResult(scalar=mock_lock))
 
         lock_info = await get_lock_status(mock_db, "cbg")
 
@@ -349,30 +290,11 @@ class TestGetLockStatus:
 class TestGetAllLockStatuses:
     """Tests for the get_all_lock_statuses function."""
 
-    @pytest.mark.asyncio
     async def test_get_all_lock_statuses_multiple_locks(self, mock_db):
         """Test getting all lock statuses with multiple active locks."""
-        now = datetime.now(timezone.utc)
-        expires = now + timedelta(seconds=300)
-
-        mock_lock1 = MagicMock()
-        mock_lock1.region = "cbg"
-        mock_lock1.locked_by_email = "user1@example.com"
-        mock_lock1.locked_by_name = "User 1"
-        mock_lock1.locked_at = now - timedelta(seconds=60)
-        mock_lock1.expires_at = expires
-
-        mock_lock2 = MagicMock()
-        mock_lock2.region = "dub"
-        mock_lock2.locked_by_email = "user2@example.com"
-        mock_lock2.locked_by_name = "User 2"
-        mock_lock2.locked_at = now - timedelta(seconds=30)
-        mock_lock2.expires_at = expires
-
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = [mock_lock1, mock_lock2]
-
-        mock_db.execute.return_value = mock_result
+        mock_lock1 = _make_lock("user1@example.com", "User 1", LOCKED_AT, EXPIRES_AT, region="cbg")
+        mock_lock2 = _make_lock("user2@example.com", "User 2", LOCKED_AT, EXPIRES_AT, region="dub")
+        mock_db.queue(FakeResult(rows=[mock_lock1, mock_lock2]))
 
         lock_statuses = await get_all_lock_statuses(mock_db)
 
@@ -382,13 +304,9 @@ class TestGetAllLockStatuses:
         assert lock_statuses["cbg"].locked_by_email == "user1@example.com"
         assert lock_statuses["dub"].locked_by_email == "user2@example.com"
 
-    @pytest.mark.asyncio
     async def test_get_all_lock_statuses_no_locks(self, mock_db):
         """Test getting all lock statuses when no locks exist."""
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = []
-
-        mock_db.execute.return_value = mock_result
+        mock_db.queue(FakeResult(rows=[]))
 
         lock_statuses = await get_all_lock_statuses(mock_db)
 
@@ -398,44 +316,22 @@ class TestGetAllLockStatuses:
 class TestCleanupExpiredLocks:
     """Tests for the cleanup_expired_locks function."""
 
-    @pytest.mark.asyncio
-    async def test_cleanup_expired_locks_removes_expired(self, mock_db):
-        """Test that cleanup removes expired locks."""
-        mock_result = MagicMock()
-        mock_result.rowcount = 2
-
-        mock_db.execute.return_value = mock_result
-
-        count = await cleanup_expired_locks(mock_db)
-
-        assert count == 2
-        mock_db.commit.assert_called()
-
-    @pytest.mark.asyncio
-    async def test_cleanup_expired_locks_region_specific(self, mock_db):
-        """Test cleanup for a specific region."""
-        mock_result = MagicMock()
-        mock_result.rowcount = 1
-
-        mock_db.execute.return_value = mock_result
-
-        count = await cleanup_expired_locks(mock_db, region="cbg")
-
-        assert count == 1
-        mock_db.commit.assert_called()
-
-    @pytest.mark.asyncio
-    async def test_cleanup_expired_locks_none_to_clean(self, mock_db):
-        """Test cleanup when no expired locks exist."""
-        mock_result = MagicMock()
-        mock_result.rowcount = 0
-
-        mock_db.execute.return_value = mock_result
+    @pytest.mark.parametrize(
+        "rowcount,region",
+        [
+            pytest.param(2, None, id="removes-expired"),
+            pytest.param(1, "cbg", id="region-specific"),
+            pytest.param(0, None, id="none-to-clean"),
+        ],
+    )
+    async def test_cleanup_expired_locks(self, mock_db, rowcount, region):
+        """Test cleanup returns the number of expired locks removed."""
+        mock_db.queue(FakeResult(rowcount=rowcount))
 
-        count = await cleanup_expired_locks(mock_db)
+        count = await cleanup_expired_locks(mock_db, region=region)
 
-        assert count == 0
-        mock_db.commit.assert_called()
+        assert count == rowcount
+        assert mock_db.commits == 1
 
 
 class TestDefaultLockTimeout:
@@ -2,51 +2,86 @@
 Tests for middleware components
 """
 
+import asyncio
+
 import pytest
 
+# Header names as httpx reports them from Headers.keys() and dict() (lowercased)
+REQUIRED_SECURITY_HEADERS = frozenset(
+    {
+        "x-content-type-options",
+        "x-frame-options",
+        "x-xss-protection",
+        "strict-transport-security",
+        "referrer-policy",
+        "permissions-policy",
+        "content-security-policy",
+    }
+)
+
+# Security headers with a fixed value
+EXPECTED_SECURITY_HEADER_VALUES = {
+    "x-content-type-options": "nosniff",
+    "x-frame-options": "DENY",
+    "x-xss-protection": "1; mode=block",
+    "referrer-policy": "strict-origin-when-cross-origin",
+}
+
+
+@pytest.fixture(scope="module")
+def health_response(shared_client):
+    """Fetches /api/health once; its headers are the same on every request"""
+    return shared_client.get("/api/health")
+
+
+@pytest.fixture(scope="module")
+def api_root_response(shared_client):
+    """Fetches /api once for tests that only inspect its headers"""
+    return shared_client.get("/api")
+
+
+@pytest.fixture(scope="module")
+def authenticated_api_response(shared_client, mock_user_data, logged_in_as):
+    """Fetches /api/build-status once as an authenticated cross-origin client"""
+    with logged_in_as(shared_client, mock_user_data):
+        return shared_client.get(
+            "/api/build-status", headers={"Origin": "http://localhost:5173"}
+        )
+
 
 @pytest.mark.middleware
 class TestSecurityHeaders:
     """Tests for security headers middleware"""
 
-    def test_security_headers_present(self, client):
+    def test_security_headers_present(self, health_response):
         """Test that security headers are added to all responses"""
-        response = client.get("/api/health")
+        # Snapshot once into a plain dict (lowercased names) for all lookups below
+        headers = dict(health_response.headers)
 
         # Verify all security headers are present
-        assert "X-Content-Type-Options" in response.headers
-        assert response.headers["X-Content-Type-Options"] == "nosniff"
-
-        assert "X-Frame-Options" in response.headers
-        assert response.headers["X-Frame-Options"] == "DENY"
-
-        assert "X-XSS-Protection" in response.headers
-        assert response.headers["X-XSS-Protection"] == "1; mode=block"
-
-        assert "Strict-Transport-Security" in response.headers
-        assert "max-age=31536000" in response.headers["Strict-Transport-Security"]
-        assert "includeSubDomains" in response.headers["Strict-Transport-Security"]
+        missing = REQUIRED_SECURITY_HEADERS - headers.keys()
+        assert not missing, f"Missing security headers: {sorted(missing)}"
 
-        assert "Referrer-Policy" in response.headers
-        assert response.headers["Referrer-Policy"] == "strict-origin-when-cross-origin"
+        # Verify fixed-value headers in one comparison
+        actual = {name: headers[name] for name in EXPECTED_SECURITY_HEADER_VALUES}
+        assert actual == EXPECTED_SECURITY_HEADER_VALUES
 
-        assert "Permissions-Policy" in response.headers
-        assert "Content-Security-Policy" in response.headers
+        hsts = headers["strict-transport-security"]
+        assert "max-age=31536000" in hsts
+        assert "includeSubDomains" in hsts
 
-    def test_csp_header_configuration(self, client):
+    def test_csp_header_configuration(self, health_response):
         """Test Content Security Policy header is properly configured"""
-        response = client.get("/api/health")
-
-        csp = response.headers["Content-Security-Policy"]
+        csp = health_response.headers["Content-Security-Policy"]
 
         # Verify CSP directives
         assert "default-src 'self'" in csp
         assert "script-src 'self'" in csp
         assert "frame-ancestors 'none'" in csp
 
-    def test_security_headers_on_api_endpoints(self, client, authenticated_user):
+    def test_security_headers_on_api_endpoints(self, authenticated_api_response):
         """Test security headers are present on API endpoints"""
-        response = client.get("/api/build-status")
+        response = authenticated_api_response
 
         assert "X-Content-Type-Options" in response.headers
         assert "X-Frame-Options" in response.headers
@@ -57,9 +92,9 @@ class TestSecurityHeaders:
 class TestRateLimiting:
     """Tests for rate limiting middleware"""
 
-    def test_rate_limit_headers_present(self, client):
+    def test_rate_limit_headers_present(self, api_root_response):
         """Test that rate limit headers are added to responses"""
-        response = client.get("/api")
+        response = api_root_response
 
         assert "X-RateLimit-Limit" in response.headers
         assert "X-RateLimit-Remaining" in response.headers
@@ -92,36 +127,37 @@ class TestRateLimiting:
         assert response.status_code == 200
 
     @pytest.mark.slow
-    def test_rate_limit_enforcement(self, client):
+    async def test_rate_limit_enforcement(self, async_client):
         """Test that rate limit is enforced after burst limit"""
+        # The limiter keys on X-Forwarded-For; a client address of its own keeps
+        # this burst from throttling other tests
+        headers = {"X-Forwarded-For": "203.0.113.10"}
+
         # Get the burst limit from first response
-        response = client.get("/api")
+        response = await async_client.get("/api", headers=headers)
         burst_limit = int(response.headers["X-RateLimit-Limit"])
 
-        # Make requests up to the burst limit
-        # Note: In a real test environment, this might be too many requests
-        # For development, we're using a high limit (100+)
-        # This test validates the mechanism works but may not hit the limit
-        for i in range(min(burst_limit + 5, 20)):
-            response = client.get("/api")
+        # Send past the limit concurrently: the limiter counts each request before
+        # awaiting the app, so exactly the remaining budget gets through
+        responses = await asyncio.gather(
+            *(async_client.get("/api", headers=headers) for _ in range(burst_limit + 4))
+        )
+        status_codes = [r.status_code for r in responses]
+        assert status_codes.count(200) == burst_limit - 1
+        assert status_codes.count(429) == 5
 
-            # If we hit rate limit, verify the response
-            if response.status_code == 429:
-                assert "Rate limit exceeded" in response.json()["error"]
-                assert "Retry-After" in response.headers
-                break
-        else:
-            # If we didn't hit the limit (high dev limit), that's also acceptable
-            pass
+        throttled = next(r for r in responses if r.status_code == 429)
+        assert "Rate limit exceeded" in throttled.json()["error"]
+        assert "Retry-After" in throttled.headers
 
 
 @pytest.mark.middleware
 class TestRequestLogging:
     """Tests for request logging middleware"""
 
-    def test_process_time_header(self, client):
+    def test_process_time_header(self, health_response):
         """Test that X-Process-Time header is added"""
-        response = client.get("/api/health")
+        response = health_response
 
         # Note: The custom logging middleware in main.py doesn't add X-Process-Time
         # but the one in middleware.py does. Since main.py uses custom middleware,
@@ -154,11 +190,9 @@ class TestCORS:
             405,
         ]  # Some endpoints might not allow OPTIONS
 
-    def test_cors_allows_credentials(self, client, authenticated_user):
+    def test_cors_allows_credentials(self, authenticated_api_response):
         """Test that CORS allows credentials"""
-        response = client.get(
-            "/api/build-status", headers={"Origin": "http://localhost:5173"}
-        )
+        response = authenticated_api_response
 
         # Request should succeed (CORS allows the origin)
         assert response.status_code == 200
@@ -168,15 +202,16 @@ class TestCORS:
 class TestMiddlewareStack:
     """Tests for middleware integration"""
 
-    def test_all_middleware_applied(self, client, authenticated_user):
+    def test_all_middleware_applied(self, authenticated_api_response):
         """Test that all middleware is applied in correct order"""
-        response = client.get("/api/build-status")
+        response = authenticated_api_response
+        headers = dict(response.headers)
 
         # Security headers (from SecurityHeadersMiddleware)
-        assert "X-Content-Type-Options" in response.headers
+        assert "x-content-type-options" in headers
 
         # Rate limiting (from RateLimitMiddleware)
-        assert "X-RateLimit-Limit" in response.headers
+        assert "x-ratelimit-limit" in headers
 
         # CORS (from CORSMiddleware) - allows credentials
         assert response.status_code == 200
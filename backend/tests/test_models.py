@@ -11,8 +11,6 @@ from app.models import (
     Server,
     ServerDetails,
     BuildStatus,
-    PreconfigData,
-    PushPreconfigRequest,
     AssignRequest,
     ServerStatus,
     AssignedStatus,
@@ -27,6 +25,29 @@ def get_valid_regions() -> list:
     return list(config.get("regions", {}).keys())
 
 
+# Fixed timestamp for datetime fields, so tests don't read the clock
+_NOW = datetime(2024, 1, 1)
+
+# Known-good Server fields for tests that only read attributes back
+_SERVER_FIELDS = {
+    "rackID": "1-E",
+    "hostname": "test",
+    "dbid": "1",
+    "serial_number": "SN-1",
+    "percent_built": 50,
+}
+
+
+def _mk_server(**overrides) -> Server:
+    """Build a Server without validation, for tests that aren't checking it"""
+    return Server.model_construct(**{**_SERVER_FIELDS, **overrides})
+
+
+VALID_DEPOT_IDS = _get_valid_depot_ids()
+INVALID_DEPOT = max(VALID_DEPOT_IDS) + 1
+_ASSIGN_FIELDS = {"serial_number": "SN-001", "hostname": "test-server", "dbid": "100001"}
+
+
 @pytest.mark.unit
 class TestUser:
     """Tests for User model"""
@@ -65,65 +86,29 @@ class TestUser:
 class TestServer:
     """Tests for Server model"""
 
-    def test_server_creation_valid(self):
+    def test_server_creation_valid(self, server_adapter, mock_server_data):
         """Test creating a valid server"""
-        server = Server(
-            rackID="1-E",
-            hostname="test-server-001",
-            dbid="100001",
-            serial_number="SN-TEST-001",
-            percent_built=75,
-            assigned_status="not assigned",
-            machine_type="Server",
-            status="installing",
-        )
+        server = server_adapter.validate_python(mock_server_data)
         assert server.rackID == "1-E"
         assert server.hostname == "test-server-001"
         assert server.percent_built == 75
 
-    def test_server_percent_built_validation_valid(self):
+    @pytest.mark.parametrize("percent", [0, 50, 100])
+    def test_server_percent_built_validation_valid(self, server_adapter, percent):
         """Test percent_built accepts values 0-100"""
-        for percent in [0, 50, 100]:
-            server = Server(
-                rackID="1-E",
-                hostname="test",
-                dbid="1",
-                serial_number="SN-1",
-                percent_built=percent,
-            )
-            assert server.percent_built == percent
+        server = server_adapter.validate_python({**_SERVER_FIELDS, "percent_built": percent})
+        assert server.percent_built == percent
 
-    def test_server_percent_built_validation_invalid(self):
+    @pytest.mark.parametrize("percent", [101, -1], ids=["over-100", "negative"])
+    def test_server_percent_built_validation_invalid(self, server_adapter, percent):
         """Test percent_built rejects values outside 0-100"""
         with pytest.raises(ValidationError) as exc_info:
-            Server(
-                rackID="1-E",
-                hostname="test",
-                dbid="1",
-                serial_number="SN-1",
-                percent_built=101,
-            )
-        assert "percent_built" in str(exc_info.value)
-
-        with pytest.raises(ValidationError) as exc_info:
-            Server(
-                rackID="1-E",
-                hostname="test",
-                dbid="1",
-                serial_number="SN-1",
-                percent_built=-1,
-            )
+            server_adapter.validate_python({**_SERVER_FIELDS, "percent_built": percent})
         assert "percent_built" in str(exc_info.value)
 
     def test_server_default_values(self):
         """Test server default values"""
-        server = Server(
-            rackID="1-E",
-            hostname="test",
-            dbid="1",
-            serial_number="SN-1",
-            percent_built=50,
-        )
+        server = _mk_server()
         assert server.assigned_status == "not assigned"
         assert server.machine_type == "Server"
         assert server.status == "installing"
@@ -136,19 +121,15 @@ class TestServerDetails:
     def test_server_details_creation(self):
         """Test creating server details with extended fields"""
         details = ServerDetails(
-            rackID="1-E",
-            hostname="test-server",
-            dbid="1",
-            serial_number="SN-1",
-            percent_built=50,
+            **_SERVER_FIELDS,
             ip_address="192.168.1.100",
             mac_address="00:1A:2B:3C:4D:5E",
             cpu_model="Intel Xeon",
             ram_gb=128,
             storage_gb=4000,
-            install_start_time=datetime.utcnow(),
-            estimated_completion=datetime.utcnow(),
-            last_heartbeat=datetime.utcnow(),
+            install_start_time=_NOW,
+            estimated_completion=_NOW,
+            last_heartbeat=_NOW,
         )
         assert details.ip_address == "192.168.1.100"
         assert details.ram_gb == 128
@@ -166,13 +147,7 @@ class TestBuildStatus:
 
     def test_build_status_creation_with_servers(self):
         """Test creating build status with servers in a dynamic region"""
-        server = Server(
-            rackID="1-E",
-            hostname="test",
-            dbid="1",
-            serial_number="SN-1",
-            percent_built=50,
-        )
+        server = _mk_server()
         # Get first region from config dynamically
         regions = get_valid_regions()
         assert len(regions) > 0, "At least one region must be configured"
@@ -188,61 +163,56 @@ class TestBuildStatus:
 class TestPreconfigData:
     """Tests for PreconfigData model"""
 
-    def test_preconfig_creation_valid(self):
+    def test_preconfig_creation_valid(self, preconfig_adapter):
         """Test creating valid preconfig"""
         valid_depot_ids = _get_valid_depot_ids()
         depot = valid_depot_ids[0]
-        preconfig = PreconfigData(
-            dbid="pre-001",
-            depot=depot,
-            appliance_size="small",
-            config={"os": "Ubuntu 22.04"},
-            created_at=datetime.utcnow(),
+        preconfig = preconfig_adapter.validate_python(
+            {
+                "dbid": "pre-001",
+                "depot": depot,
+                "appliance_size": "small",
+                "config": {"os": "Ubuntu 22.04"},
+                "created_at": _NOW,
+            }
         )
         assert preconfig.dbid == "pre-001"
         assert preconfig.depot == depot
         assert preconfig.appliance_size == "small"
         assert preconfig.config == {"os": "Ubuntu 22.04"}
 
-    def test_preconfig_depot_validation_valid(self):
+    @pytest.mark.parametrize("depot", VALID_DEPOT_IDS)
+    def test_preconfig_depot_validation_valid(self, preconfig_adapter, depot):
         """Test depot validation accepts valid values from config"""
-        valid_depot_ids = _get_valid_depot_ids()
-        for depot in valid_depot_ids:
-            preconfig = PreconfigData(
-                dbid="pre-001", depot=depot, config={}, created_at=datetime.utcnow()
-            )
-            assert preconfig.depot == depot
+        preconfig = preconfig_adapter.validate_python(
+            {"dbid": "pre-001", "depot": depot, "config": {}, "created_at": _NOW}
+        )
+        assert preconfig.depot == depot
 
-    def test_preconfig_depot_validation_invalid(self):
+    def test_preconfig_depot_validation_invalid(self, preconfig_adapter):
         """Test depot validation rejects invalid values"""
-        valid_depot_ids = _get_valid_depot_ids()
-        # Find an invalid depot (one that's not in the valid list)
-        invalid_depot = max(valid_depot_ids) + 1
         with pytest.raises(ValidationError) as exc_info:
-            PreconfigData(
-                dbid="pre-001", depot=invalid_depot, config={}, created_at=datetime.utcnow()
+            preconfig_adapter.validate_python(
+                {"dbid": "pre-001", "depot": INVALID_DEPOT, "config": {}, "created_at": _NOW}
             )
-        assert f"depot must be one of {valid_depot_ids}" in str(exc_info.value)
+        assert f"depot must be one of {VALID_DEPOT_IDS}" in str(exc_info.value)
 
 
 @pytest.mark.unit
 class TestPushPreconfigRequest:
     """Tests for PushPreconfigRequest model"""
 
-    def test_push_preconfig_request_valid(self):
+    @pytest.mark.parametrize("depot", VALID_DEPOT_IDS)
+    def test_push_preconfig_request_valid(self, push_preconfig_adapter, depot):
         """Test creating valid push preconfig request with depots from config"""
-        valid_depot_ids = _get_valid_depot_ids()
-        for depot in valid_depot_ids:
-            request = PushPreconfigRequest(depot=depot)
-            assert request.depot == depot
+        request = push_preconfig_adapter.validate_python({"depot": depot})
+        assert request.depot == depot
 
-    def test_push_preconfig_request_invalid(self):
+    def test_push_preconfig_request_invalid(self, push_preconfig_adapter):
         """Test push preconfig request with invalid depot"""
-        valid_depot_ids = _get_valid_depot_ids()
-        invalid_depot = max(valid_depot_ids) + 1
         with pytest.raises(ValidationError) as exc_info:
-            PushPreconfigRequest(depot=invalid_depot)
-        assert f"depot must be one of {valid_depot_ids}" in str(exc_info.value)
+            push_preconfig_adapter.validate_python({"depot": INVALID_DEPOT})
+        assert f"depot must be one of {VALID_DEPOT_IDS}" in str(exc_info.value)
 
 
 @pytest.mark.unit
@@ -258,10 +228,17 @@ class TestAssignRequest:
         assert request.hostname == "test-server"
         assert request.dbid == "100001"
 
-    def test_assign_request_empty_fields(self):
+    @pytest.mark.parametrize("field", list(_ASSIGN_FIELDS))
+    def test_assign_request_empty_fields(self, assign_request_adapter, field):
         """Test assign request rejects empty fields"""
+        with pytest.raises(ValidationError) as exc_info:
+            assign_request_adapter.validate_python({**_ASSIGN_FIELDS, field: ""})
+        assert field in str(exc_info.value)
+
+    def test_assign_request_invalid_json(self):
+        """Test assign request rejects a body that is not JSON"""
         with pytest.raises(ValidationError):
-            AssignRequest(serial_number="", hostname="test", dbid="1")
+            AssignRequest.model_validate_json("not-json")
 
 
 @pytest.mark.unit
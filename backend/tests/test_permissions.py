@@ -3,6 +3,13 @@ Tests for permission system
 """
 
 import pytest
+
+from app.permissions import (
+    check_depot_access,
+    check_region_access,
+    check_user_has_access,
+    get_user_permissions,
+)
 from app.routers.config import get_config
 
 
@@ -40,36 +47,52 @@ def get_depot_for_region(region: str) -> int | None:
     return regions.get(region, {}).get("depot_id")
 
 
+# Values from config.json, read once at import
+VALID_REGIONS = get_valid_regions()
+ADMIN_EMAIL = get_admin_email()
+ADMIN_EMAIL_CASINGS = [ADMIN_EMAIL.upper(), ADMIN_EMAIL.title()]
+BUILDER_EMAIL, BUILDER_REGION = get_builder_info_for_region(0)
+OTHER_REGIONS = [region for region in VALID_REGIONS if region != BUILDER_REGION]
+DEPOT_BY_REGION = {region: get_depot_for_region(region) for region in VALID_REGIONS}
+
+# (email, depot, expected access): admin reaches every depot, the builder only their own
+DEPOT_CASES = [
+    pytest.param(email, depot, expected, id=f"{role}-{region}")
+    for region, depot in DEPOT_BY_REGION.items()
+    if depot
+    for role, email, expected in (
+        ("admin", ADMIN_EMAIL, True),
+        ("builder", BUILDER_EMAIL, region == BUILDER_REGION),
+    )
+]
+
+
+def _detail(response) -> str:
+    """Lowercased error detail from a JSON error response"""
+    return response.json().get("detail", "").lower()
+
+
 @pytest.mark.unit
 class TestPermissionFunctions:
     """Tests for permission checking functions"""
 
     def test_admin_has_all_regions(self):
         """Admin email should have access to all regions"""
-        from app.permissions import get_user_permissions
-
-        admin_email = get_admin_email()
-        is_admin, allowed_regions = get_user_permissions(admin_email)
-        valid_regions = get_valid_regions()
+        is_admin, allowed_regions = get_user_permissions(ADMIN_EMAIL)
 
         assert is_admin is True
-        for region in valid_regions:
+        for region in VALID_REGIONS:
             assert region in allowed_regions
 
     def test_builder_has_assigned_region_only(self):
         """Builder should only have access to their assigned region"""
-        from app.permissions import get_user_permissions
-
-        builder_email, expected_region = get_builder_info_for_region(0)
-        is_admin, allowed_regions = get_user_permissions(builder_email)
+        is_admin, allowed_regions = get_user_permissions(BUILDER_EMAIL)
 
         assert is_admin is False
-        assert allowed_regions == [expected_region]
+        assert allowed_regions == [BUILDER_REGION]
 
     def test_unknown_user_has_no_access(self):
         """User not in any permission list should have no access"""
-        from app.permissions import get_user_permissions, check_user_has_access
-
         is_admin, allowed_regions = get_user_permissions("unknown@example.com")
 
         assert is_admin is False
@@ -78,131 +101,97 @@ class TestPermissionFunctions:
         has_access, _ = check_user_has_access("unknown@example.com")
         assert has_access is False
 
-    def test_case_insensitive_email(self):
+    @pytest.mark.parametrize("email", ADMIN_EMAIL_CASINGS, ids=["upper", "title"])
+    def test_case_insensitive_email(self, email):
         """Email matching should be case insensitive"""
-        from app.permissions import get_user_permissions
-
-        admin_email = get_admin_email()
-        is_admin1, _ = get_user_permissions(admin_email.upper())
-        is_admin2, _ = get_user_permissions(admin_email.title())
-
-        assert is_admin1 is True
-        assert is_admin2 is True
+        is_admin, _ = get_user_permissions(email)
+        assert is_admin is True
 
-    def test_check_region_access_admin(self):
+    @pytest.mark.parametrize("region", VALID_REGIONS)
+    def test_check_region_access_admin(self, region):
         """Admin should have access to any region"""
-        from app.permissions import check_region_access
-
-        admin_email = get_admin_email()
-        valid_regions = get_valid_regions()
-
-        for region in valid_regions:
-            assert check_region_access(admin_email, region) is True
+        assert check_region_access(ADMIN_EMAIL, region) is True
 
-    def test_check_region_access_builder(self):
+    @pytest.mark.parametrize("region", VALID_REGIONS)
+    def test_check_region_access_builder(self, region):
         """Builder should only have access to their region"""
-        from app.permissions import check_region_access
+        expected = region == BUILDER_REGION
+        assert check_region_access(BUILDER_EMAIL, region) is expected
 
-        builder_email, builder_region = get_builder_info_for_region(0)
-        valid_regions = get_valid_regions()
-
-        for region in valid_regions:
-            if region == builder_region:
-                assert check_region_access(builder_email, region) is True
-            else:
-                assert check_region_access(builder_email, region) is False
-
-    def test_check_depot_access(self):
+    @pytest.mark.parametrize("email,depot,expected", DEPOT_CASES)
+    def test_check_depot_access(self, email, depot, expected):
         """Depot access should map correctly to region access"""
-        from app.permissions import check_depot_access
-
-        admin_email = get_admin_email()
-        builder_email, builder_region = get_builder_info_for_region(0)
-        valid_regions = get_valid_regions()
-
-        # Admin has access to all depots
-        for region in valid_regions:
-            depot = get_depot_for_region(region)
-            if depot:
-                assert check_depot_access(admin_email, depot) is True
-
-        # Builder only has access to their region's depot
-        for region in valid_regions:
-            depot = get_depot_for_region(region)
-            if depot:
-                if region == builder_region:
-                    assert check_depot_access(builder_email, depot) is True
-                else:
-                    assert check_depot_access(builder_email, depot) is False
+        assert check_depot_access(email, depot) is expected
 
 
 @pytest.mark.integration
 class TestPermissionEndpoints:
     """Integration tests for permission checks on endpoints"""
 
-    def test_unauthorized_user_denied(self, client, authenticated_unauthorized_user):
+    async def test_unauthorized_user_denied(
+        self, async_client_clean, authenticated_unauthorized_user
+    ):
         """User not in permissions should get 403"""
-        response = client.get("/api/build-status")
+        response = await async_client_clean.get("/api/build-status")
         assert response.status_code == 403
-        assert "not authorized" in response.json()["detail"].lower()
+        assert "not authorized" in _detail(response)
 
-    def test_admin_can_access_all_regions(self, client, authenticated_admin):
+    @pytest.mark.parametrize("region", VALID_REGIONS)
+    async def test_admin_can_access_all_regions(
+        self, async_client_clean, authenticated_admin, region
+    ):
         """Admin should be able to access all regions"""
-        valid_regions = get_valid_regions()
-        for region in valid_regions:
-            response = client.get(f"/api/preconfig/{region}")
-            assert response.status_code == 200, f"Failed for region {region}"
+        response = await async_client_clean.get(f"/api/preconfig/{region}")
+        assert response.status_code == 200
 
-    def test_builder_can_access_own_region(self, client, authenticated_first_region_builder):
+    async def test_builder_can_access_own_region(
+        self, async_client_clean, authenticated_first_region_builder
+    ):
         """Builder should be able to access their assigned region"""
-        _, builder_region = get_builder_info_for_region(0)
-        response = client.get(f"/api/preconfig/{builder_region}")
+        response = await async_client_clean.get(f"/api/preconfig/{BUILDER_REGION}")
         assert response.status_code == 200
 
-    def test_builder_cannot_access_other_region(self, client, authenticated_first_region_builder):
+    @pytest.mark.parametrize("region", OTHER_REGIONS)
+    async def test_builder_cannot_access_other_region(
+        self, async_client_clean, authenticated_first_region_builder, region
+    ):
         """Builder should not be able to access other regions"""
-        _, builder_region = get_builder_info_for_region(0)
-        valid_regions = get_valid_regions()
-
-        for region in valid_regions:
-            if region != builder_region:
-                response = client.get(f"/api/preconfig/{region}")
-                assert response.status_code == 403, f"Expected 403 for region {region}"
-                assert "do not have permission" in response.json()["detail"].lower()
+        response = await async_client_clean.get(f"/api/preconfig/{region}")
+        assert response.status_code == 403
+        assert "do not have permission" in _detail(response)
 
-    def test_build_status_filtered_for_builder(self, client, authenticated_first_region_builder):
+    async def test_build_status_filtered_for_builder(
+        self, async_client_clean, authenticated_first_region_builder
+    ):
         """Build status should only show builder's region"""
-        _, builder_region = get_builder_info_for_region(0)
-        valid_regions = get_valid_regions()
-
-        response = client.get("/api/build-status")
+        response = await async_client_clean.get("/api/build-status")
         assert response.status_code == 200
 
         data = response.json()
         # Builder should see their region
-        assert builder_region in data
+        assert BUILDER_REGION in data
         # Other regions should be empty (filtered out)
-        for region in valid_regions:
-            if region != builder_region:
+        for region in VALID_REGIONS:
+            if region != BUILDER_REGION:
                 assert data.get(region, []) == []
 
-    def test_build_status_shows_all_for_admin(self, client, authenticated_admin):
+    async def test_build_status_shows_all_for_admin(
+        self, async_client_clean, authenticated_admin
+    ):
         """Admin should see all regions in build status"""
-        valid_regions = get_valid_regions()
-
-        response = client.get("/api/build-status")
+        response = await async_client_clean.get("/api/build-status")
         assert response.status_code == 200
 
         data = response.json()
         # Admin should see all regions
-        for region in valid_regions:
+        for region in VALID_REGIONS:
             assert region in data
 
-    def test_me_endpoint_includes_permissions(self, client, authenticated_admin):
+    async def test_me_endpoint_includes_permissions(
+        self, async_client_clean, authenticated_admin
+    ):
         """GET /api/me should include permission fields"""
-        valid_regions = get_valid_regions()
-
-        response = client.get("/api/me")
+        response = await async_client_clean.get("/api/me")
         assert response.status_code == 200
 
         data = response.json()
@@ -210,23 +199,23 @@ class TestPermissionEndpoints:
         assert "allowed_regions" in data
         assert data["is_admin"] is True
         # Admin should have all regions
-        for region in valid_regions:
+        for region in VALID_REGIONS:
             assert region in data["allowed_regions"]
 
-    def test_me_endpoint_builder_permissions(self, client, authenticated_first_region_builder):
+    async def test_me_endpoint_builder_permissions(
+        self, async_client_clean, authenticated_first_region_builder
+    ):
         """GET /api/me should show correct permissions for builder"""
-        _, builder_region = get_builder_info_for_region(0)
-
-        response = client.get("/api/me")
+        response = await async_client_clean.get("/api/me")
         assert response.status_code == 200
 
         data = response.json()
         assert data["is_admin"] is False
-        assert data["allowed_regions"] == [builder_region]
+        assert data["allowed_regions"] == [BUILDER_REGION]
 
-    def test_config_endpoint_public(self, client):
+    async def test_config_endpoint_public(self, async_client_clean):
         """Config endpoint should not require authentication"""
-        response = client.get("/api/config")
+        response = await async_client_clean.get("/api/config")
         assert response.status_code == 200
 
 
@@ -234,26 +223,28 @@ class TestPermissionEndpoints:
 class TestPushPreconfigPermissions:
     """Tests for push-preconfig permission checks"""
 
-    def test_admin_can_push_to_any_region(self, client, authenticated_admin):
+    @pytest.mark.parametrize("region", VALID_REGIONS)
+    async def test_admin_can_push_to_any_region(
+        self, async_client_clean, authenticated_admin, region
+    ):
         """Admin should be able to push to any region"""
-        valid_regions = get_valid_regions()
-        for region in valid_regions:
-            response = client.post(f"/api/preconfig/{region}/push")
-            assert response.status_code == 200, f"Failed for region {region}"
+        response = await async_client_clean.post(f"/api/preconfig/{region}/push")
+        assert response.status_code == 200
 
-    def test_builder_can_push_to_own_region(self, client, authenticated_first_region_builder):
+    async def test_builder_can_push_to_own_region(
+        self, async_client_clean, authenticated_first_region_builder
+    ):
         """Builder should be able to push to their region"""
-        _, builder_region = get_builder_info_for_region(0)
-        response = client.post(f"/api/preconfig/{builder_region}/push")
+        response = await async_client_clean.post(
+            f"/api/preconfig/{BUILDER_REGION}/push"
+        )
         assert response.status_code == 200
 
-    def test_builder_cannot_push_to_other_region(self, client, authenticated_first_region_builder):
+    @pytest.mark.parametrize("region", OTHER_REGIONS)
+    async def test_builder_cannot_push_to_other_region(
+        self, async_client_clean, authenticated_first_region_builder, region
+    ):
         """Builder should not be able to push to other regions"""
-        _, builder_region = get_builder_info_for_region(0)
-        valid_regions = get_valid_regions()
-
-        for region in valid_regions:
-            if region != builder_region:
-                response = client.post(f"/api/preconfig/{region}/push")
-                assert response.status_code == 403, f"Expected 403 for region {region}"
-                assert "do not have permission" in response.json()["detail"].lower()
+        response = await async_client_clean.post(f"/api/preconfig/{region}/push")
+        assert response.status_code == 403
+        assert "do not have permission" in _detail(response)